@@ -86,22 +86,44 @@ NOTES:
 - Bitquery API supports both v1 and v2 tokens (auto-detected)
 """
 
+import copy
+import functools
 import os
+import re
 import uuid
 import json
 import pathlib
-from decimal import Decimal, ROUND_DOWN
-from typing import Any, List, Dict, Optional
+from decimal import Decimal
+from typing import Any, List, Dict, Optional, Tuple
 import time
 
 # Simple in-memory cache to avoid excessive Bitquery calls
-# Keyed by network:address (lowercased)
+# Keyed by network:address (lowercased); only successful results are stored
 BALANCE_CACHE_TTL = int(os.getenv("BALANCE_CACHE_TTL", "600"))  # seconds
-_BALANCE_CACHE: Dict[str, Dict[str, Any]] = {}  # { key: {"timestamp": float, "data": dict} }
+_BALANCE_CACHE: Dict[str, Dict[str, Any]] = {}  # { key: {"timestamp": float (monotonic), "data": dict} }
+
+try:
+    import orjson  # Optional: faster parsing of large Bitquery responses
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  Optional: lets requests decode br responses
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
 
 import uvicorn
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.units import PLAIN_AMOUNT_RE, pow10, to_smallest, to_smallest_decimal
 
 # Load environment variables from .env file
 # Try to load from backend directory first, then current directory
@@ -156,28 +178,51 @@ ENV_CRONOS_NETWORK = "CRONOS_NETWORK"
 BITQUERY_API_V1_URL = "https://graphql.bitquery.io"
 BITQUERY_API_V2_URL = "https://graphql.bitquery.io/v2"
 
+# Shared HTTP session so repeat Bitquery/RPC calls reuse pooled TCP+TLS connections.
+# The balance query is read-only, so POSTs are safe to retry on connection errors and
+# gateway/rate-limit statuses. Read timeouts are not retried (read=0, as for the RPC
+# session in defi/tectonic/providers.py) so a stalled request can't hold a worker ~3x.
+# Only advertise encodings we can decode: br needs a brotli package installed
+_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+}
+_SESSION = requests.Session()
+_SESSION.headers.update(_JSON_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=None,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# ERC-20 decimals() selector: keccak256("decimals()")[:4], precomputed for raw eth_call
+ERC20_DECIMALS_SELECTOR = "0x313ce567"
+
+# Per-address selection: native coin balance (CRO) plus token balances (CRC-20).
+# Every field is consumed downstream (name feeds the test-token filter and the
+# result dicts), so only formatting is trimmed: no comments or indentation are sent.
+_ADDRESS_BALANCE_FIELDS = "{ balance balances { currency { name symbol decimals address } value } }"
+
 # GraphQL query to get user token balances using Bitquery API v2
 # This query fetches native CRO balance and all token balances for an address on Cronos
-GET_USER_BALANCES_QUERY = """
-query GetCronosBalances($address: String!) {
-  ethereum(network: cronos) {
-    address(address: {is: $address}) {
-      # Native coin balance (CRO)
-      balance
-      # Token balances (CRC-20)
-      balances {
-        currency {
-          name
-          symbol
-          decimals
-          address
-        }
-        value
-      }
-    }
-  }
-}
-"""
+GET_USER_BALANCES_QUERY = (
+    "query GetCronosBalances($address: String!) { ethereum(network: cronos) "
+    f"{{ address(address: {{is: $address}}) {_ADDRESS_BALANCE_FIELDS} }} }}"
+)
+
+# Bitquery aliases per batched request; larger batches are split
+MAX_BATCH_ADDRESSES = 25
 
 # Message types
 MESSAGE_TYPE_AI = "ai"
@@ -277,6 +322,10 @@ def create_agent_card(port: int) -> AgentCard:
     )
 
 
+# "0x" followed by one or more hex digits (length is not enforced here)
+_HEX_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]+")
+
+
 def validate_address(address: str) -> bool:
     """Validate Ethereum/Cronos address format.
     
@@ -286,14 +335,7 @@ def validate_address(address: str) -> bool:
     Returns:
         True if address is valid, False otherwise
     """
-    if not address.startswith("0x"):
-        return False
-    if len(address) < 3:
-        return False
-    hex_part = address[2:]
-    if not all(c in "0123456789abcdefABCDEF" for c in hex_part):
-        return False
-    return True
+    return _HEX_ADDRESS_RE.fullmatch(address) is not None
 
 
 def get_bitquery_api_key() -> str:
@@ -339,389 +381,546 @@ def get_bitquery_api_key() -> str:
     return api_key.strip()
 
 
-def format_balance(amount: str, decimals: int = 18) -> str:
-    """Format balance from string amount to human-readable format.
-    
-    Args:
-        amount: Balance as string (from GraphQL response)
-        decimals: Number of decimals (default: 18)
-        
-    Returns:
-        Formatted balance string
-    """
+def _json_loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Only filter tokens that clearly indicate test tokens in name or symbol.
+# ASCII-only case folding matches the previous str.lower() check exactly.
+_TEST_TOKEN_RE = re.compile("test", re.IGNORECASE | re.ASCII)
+
+
+def _is_test_token(balance: Dict[str, Any]) -> bool:
+    """Check if a token is a test token."""
+    return bool(
+        _TEST_TOKEN_RE.search(balance.get("name") or "")
+        or _TEST_TOKEN_RE.search(balance.get("symbol") or "")
+    )
+
+
+def _balance_sort_key(balance: Dict[str, Any]) -> tuple:
+    """Sort key: native token first, then by value descending."""
+    is_native = balance.get("is_native", False)
     try:
-        # Handle both string and numeric inputs
-        if isinstance(amount, str):
-            # Check if it's already a decimal number (has a dot)
-            if '.' in amount:
-                # Already in human-readable format
-                return f"{float(amount):.6f}"
-            # Otherwise, it's in smallest units (wei/satoshi)
-            amount_int = int(amount)
-        else:
-            amount_int = int(amount)
-        
-        # Convert from smallest unit to human-readable
-        if decimals > 0:
-            balance = amount_int / (10 ** decimals)
-        else:
-            balance = float(amount_int)
-        
-        # Return formatted with up to 6 decimal places, removing trailing zeros
-        formatted = f"{balance:.6f}".rstrip('0').rstrip('.')
-        return formatted if formatted else "0"
-    except (ValueError, TypeError) as e:
-        # If conversion fails, return the original value
-        return str(amount)
+        value = float(balance.get("value", "0"))
+    except (ValueError, TypeError):
+        value = 0
+    return (not is_native, -value)
 
 
 def _cache_key(address: str, network: str = "cronos") -> str:
     return f"{network}:{address.lower()}"
 
 
-def fetch_cronos_balances(address: str) -> Dict[str, Any]:
-    """Fetch balances from Cronos using Bitquery API.
+def _store_cached_balance(key: str, result: Dict[str, Any]) -> None:
+    """Store a result in the balance cache, evicting expired entries first."""
+    now = time.monotonic()
+    # Snapshot + pop(): writers may run concurrently (API requests offloaded to worker
+    # threads), so another thread can resize the dict or evict the same key.
+    expired = [k for k, entry in list(_BALANCE_CACHE.items()) if now - entry["timestamp"] >= BALANCE_CACHE_TTL]
+    for k in expired:
+        _BALANCE_CACHE.pop(k, None)
+    _BALANCE_CACHE[key] = {"timestamp": now, "data": result}
 
-    Fetches all tokens with balance > 0 from Bitquery.
-    Zero balance tokens are excluded.
 
-    Uses a simple in-memory cache to avoid repeated calls to Bitquery. Cached entries
-    are stored for BALANCE_CACHE_TTL seconds and returned directly when valid.
+def _check_balance_request(address: str) -> Optional[Dict[str, Any]]:
+    """Return an early result for an invalid address or a cache hit, else None."""
+    # Validate address format
+    if not validate_address(address):
+        return {
+            "success": False,
+            "error": f"Invalid address format: {address}. Address must start with 0x and contain valid hexadecimal characters.",
+        }
+
+    # Check cache first
+    key = _cache_key(address, "cronos")
+    cache_entry = _BALANCE_CACHE.get(key)
+    if cache_entry:
+        age = time.monotonic() - float(cache_entry.get("timestamp", 0))
+        if age < BALANCE_CACHE_TTL:
+            print(f"Debug: cache hit for {address} (age={age:.1f}s)")
+            # Deep copy so callers can't mutate the cached balances list
+            cached = copy.deepcopy(cache_entry["data"])
+            cached["cached"] = True
+            return cached
+        else:
+            print(f"Debug: cache expired for {address} (age={age:.1f}s)")
+            _BALANCE_CACHE.pop(key, None)
+
+    return None
+
+
+# On-chain decimals() answers keyed by (rpc_url, lowercased token address)
+_DECIMALS_CACHE: Dict[Tuple[str, str], int] = {}
+
+
+def _parse_decimals(decimals_raw: Any) -> Optional[int]:
+    """Parse a decimals value from Bitquery, returning None when missing or invalid."""
+    if decimals_raw is None:
+        return None
+    try:
+        return int(decimals_raw)
+    except (ValueError, TypeError):
+        return None
+
+
+def _hex_address(contract_addr: str) -> str:
+    return contract_addr if contract_addr.startswith("0x") else f"0x{contract_addr}"
+
+
+def _decimals_call(request_id: int, hex_address: str) -> Dict[str, Any]:
+    """JSON-RPC eth_call request for an ERC-20 decimals()."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "eth_call",
+        "params": [
+            {"to": hex_address, "data": ERC20_DECIMALS_SELECTOR},
+            "latest",
+        ],
+        "id": request_id,
+    }
+
+
+def _fetch_decimals_single(rpc_url: str, hex_address: str) -> Optional[int]:
+    """Fetch one token's decimals() via its own eth_call."""
+    try:
+        rpc_resp = _SESSION.post(rpc_url, json=_decimals_call(1, hex_address), timeout=10)
+        rpc_resp.raise_for_status()
+        rpc_result = _json_loads(rpc_resp.content).get("result")
+        if rpc_result and rpc_result != "0x":
+            decimals = int(rpc_result, 16)
+            print(f"Debug: fetched decimals={decimals} for {hex_address} via RPC")
+            return decimals
+    except Exception as e:
+        print(f"Debug: unable to fetch decimals for {hex_address} via RPC: {e}")
+    return None
+
+
+def fetch_token_decimals(hex_addresses: List[str], rpc_url: str) -> Dict[str, int]:
+    """Fetch decimals() for several tokens in a single JSON-RPC batch request.
+
+    Previously resolved tokens are served from _DECIMALS_CACHE. Tokens the batch
+    didn't answer (or every token, if the endpoint rejects batches) fall back to
+    one eth_call each.
 
     Args:
-        address: Wallet address to check
+        hex_addresses: 0x-prefixed token contract addresses
+        rpc_url: Cronos JSON-RPC endpoint
 
     Returns:
-        Dictionary with balance information
+        Mapping of address to decimals for the tokens that could be resolved
     """
+    # ERC-20 decimals are immutable, so earlier answers are reused for the process lifetime
+    resolved: Dict[str, int] = {}
+    for addr in hex_addresses:
+        cached = _DECIMALS_CACHE.get((rpc_url, addr.lower()))
+        if cached is not None:
+            resolved[addr] = cached
+    hex_addresses = [addr for addr in hex_addresses if addr not in resolved]
+    if not hex_addresses:
+        return resolved
+
+    answered = set()
     try:
-        # Validate address format
-        if not validate_address(address):
-            return {
-                "success": False,
-                "error": f"Invalid address format: {address}. Address must start with 0x and contain valid hexadecimal characters.",
-            }
+        batch = [_decimals_call(i, addr) for i, addr in enumerate(hex_addresses)]
+        rpc_resp = _SESSION.post(rpc_url, json=batch, timeout=10)
+        rpc_resp.raise_for_status()
+        replies = _json_loads(rpc_resp.content)
+        if not isinstance(replies, list):
+            raise ValueError("endpoint did not return a batch response")
+        for reply in replies:
+            idx = reply.get("id")
+            if not isinstance(idx, int) or not 0 <= idx < len(hex_addresses):
+                continue
+            answered.add(idx)
+            rpc_result = reply.get("result")
+            if rpc_result and rpc_result != "0x":
+                resolved[hex_addresses[idx]] = int(rpc_result, 16)
+        print(f"Debug: fetched decimals for {len(resolved)}/{len(hex_addresses)} tokens in one RPC batch")
+    except Exception as e:
+        print(f"Debug: batched decimals RPC failed ({e}); falling back to per-token calls")
 
-        # Check cache first
-        key = _cache_key(address, "cronos")
-        cache_entry = _BALANCE_CACHE.get(key)
-        if cache_entry:
-            age = time.time() - float(cache_entry.get("timestamp", 0))
-            if age < BALANCE_CACHE_TTL:
-                print(f"Debug: cache hit for {address} (age={age:.1f}s)")
-                cached = cache_entry["data"].copy()
-                cached["cached"] = True
-                return cached
-            else:
-                print(f"Debug: cache expired for {address} (age={age:.1f}s)")
-                _BALANCE_CACHE.pop(key, None)
+    for idx, addr in enumerate(hex_addresses):
+        if idx not in answered:
+            decimals = _fetch_decimals_single(rpc_url, addr)
+            if decimals is not None:
+                resolved[addr] = decimals
 
-        # Get API key - catch ValueError if missing
+    for addr in hex_addresses:
+        if addr in resolved:
+            _DECIMALS_CACHE[(rpc_url, addr.lower())] = resolved[addr]
+    return resolved
+
+
+@functools.lru_cache(maxsize=4)
+def _bitquery_endpoint(api_key: str) -> Tuple[str, Dict[str, str]]:
+    """Return the Bitquery (api_url, auth headers) for an API key.
+
+    API v2 tokens typically start with "ory_at_" and use an Authorization header;
+    API v1 tokens use an X-API-KEY header. Content-Type/Accept are preset on the
+    HTTP clients (_JSON_HEADERS).
+
+    Memoized since the key is fixed per process; callers must not mutate the headers.
+    """
+    if api_key.startswith("ory_at_") or api_key.startswith("Bearer "):
+        # API v2 uses Authorization header with Bearer token
+        if not api_key.startswith("Bearer "):
+            return BITQUERY_API_V2_URL, {"Authorization": f"Bearer {api_key}"}
+        return BITQUERY_API_V2_URL, {"Authorization": api_key}
+    # API v1 uses X-API-KEY header
+    return BITQUERY_API_V1_URL, {"X-API-KEY": api_key}
+
+
+def _bitquery_request(api_key: str, address: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """Build the Bitquery balance request.
+
+    Returns:
+        Tuple of (api_url, auth headers, GraphQL payload)
+    """
+    api_url, headers = _bitquery_endpoint(api_key)
+    payload = {
+        "query": GET_USER_BALANCES_QUERY,
+        "variables": {"address": address},
+    }
+    return api_url, headers, payload
+
+
+def build_batched_query(addresses: List[str]) -> str:
+    """Build one GraphQL document querying several addresses via aliases a0, a1, ...
+
+    Addresses are inlined as literals, so callers must pass validated hex addresses.
+
+    Args:
+        addresses: Validated wallet addresses (at most MAX_BATCH_ADDRESSES)
+
+    Returns:
+        GraphQL query string
+    """
+    if len(addresses) > MAX_BATCH_ADDRESSES:
+        raise ValueError(f"At most {MAX_BATCH_ADDRESSES} addresses per batched query")
+    fields = "\n".join(
+        f'  a{i}: ethereum(network: cronos) {{ address(address: {{is: "{addr}"}}) {_ADDRESS_BALANCE_FIELDS} }}'
+        for i, addr in enumerate(addresses)
+    )
+    return f"query GetCronosBalancesBatch {{\n{fields}\n}}"
+
+
+def _bitquery_http_error(response: Any) -> Optional[str]:
+    """Return an error message for a 401/403 Bitquery response, else None."""
+    if response.status_code == 401:
+        error_detail = "Unauthorized - Invalid API key. Please check your BITQUERY_API_KEY."
         try:
-            api_key = get_bitquery_api_key()
-        except ValueError as e:
-            return {
-                "address": address,
-                "success": False,
-                "error": str(e),
-            }
+            error_data = _json_loads(response.content)
+            if "errors" in error_data:
+                error_detail += f" Details: {_json_dumps(error_data['errors'])}"
+            elif "message" in error_data:
+                error_detail += f" Details: {error_data['message']}"
+        except:
+            error_detail += f" Response: {response.text[:200]}"
+        return error_detail
+    if response.status_code == 403:
+        error_detail = "Forbidden - The API endpoint may require authentication or have access restrictions."
+        try:
+            error_data = _json_loads(response.content)
+            if "errors" in error_data:
+                error_detail += f" Details: {_json_dumps(error_data['errors'])}"
+        except:
+            error_detail += f" Response: {response.text[:200]}"
+        return error_detail
+    return None
+
 
-        variables = {
+def _handle_bitquery_response(address: str, response: Any) -> Dict[str, Any]:
+    """Turn a Bitquery HTTP response into a balance result.
+
+    Successful results are stored in the balance cache.
+    """
+    error_detail = _bitquery_http_error(response)
+    if error_detail:
+        return {
             "address": address,
+            "error": error_detail,
+            "success": False,
         }
-        payload = {
-            "query": GET_USER_BALANCES_QUERY,
-            "variables": variables,
+    response.raise_for_status()
+    data = _json_loads(response.content)
+
+    if "errors" in data:
+        return {
+            "address": address,
+            "error": f"GraphQL errors: {_json_dumps(data['errors'])}",
+            "success": False,
         }
-        
-        # Determine API version and set headers/URL accordingly
-        # API v2 tokens typically start with "ory_at_" and use Authorization header
-        # API v1 tokens use X-API-KEY header
-        is_v2_token = api_key.startswith("ory_at_") or api_key.startswith("Bearer ")
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
+
+    # Parse Bitquery API v2 response structure
+    return _build_balance_result(address, data.get("data", {}).get("ethereum", {}))
+
+
+def _build_balance_result(address: str, ethereum_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build (and cache) the balance result from one address's `ethereum` GraphQL node."""
+    address_data = ethereum_data.get("address", [])
+
+    if not address_data:
+        # Address not found or has never had any activity - return zero balance
+        return {
+            "address": address,
+            "balances": [{
+                "currency": {"name": "Cronos", "symbol": "CRO"},
+                "value": "0",
+                "symbol": "CRO",
+                "name": "Cronos",
+                "decimals": 18,
+                "contract": "",
+                "is_native": True,
+            }],
+            "success": True,
+            "total_fetched": 1,
+            "filtered_out": 0,
         }
-        
-        if is_v2_token:
-            # API v2 uses Authorization header with Bearer token
-            if not api_key.startswith("Bearer "):
-                headers["Authorization"] = f"Bearer {api_key}"
-            else:
-                headers["Authorization"] = api_key
-            api_url = BITQUERY_API_V2_URL
+
+    address_info = address_data[0]
+    # Handle case where balance might be None, missing, or empty string
+    native_balance = address_info.get("balance")
+    if native_balance is None or native_balance == "":
+        native_balance = "0"
+    balances_list = address_info.get("balances", []) or []
+
+    # Transform Bitquery format to our standard format in a single pass: kept balances,
+    # filtered-out test tokens and the first few formatted entries (for debugging)
+    kept_balances: List[Dict[str, Any]] = []
+    filtered_out: List[Dict[str, Any]] = []
+
+    # Always add native CRO balance (even if 0) so users can see their balance status
+    try:
+        # Bitquery returns native balance in different formats:
+        # - As decimal string (e.g., "24827.849010682339425216") - already in CRO units
+        # - As integer string in wei (e.g., "24827849010682339425216") - in smallest units
+        # - May be "0", "0.0", or None if balance is zero
+        # We need to detect the format and convert to wei (smallest units) for storage
+        native_balance_str = str(native_balance).strip() if native_balance else "0"
+
+        if '.' in native_balance_str:
+            # Already in decimal format (CRO units), convert to wei (even if 0)
+            native_balance_wei = to_smallest(native_balance_str, 18)
+            kept_balances.append({
+                "currency": {"name": "Cronos", "symbol": "CRO"},
+                "value": str(native_balance_wei),
+                "symbol": "CRO",
+                "name": "Cronos",
+                "decimals": 18,
+                "contract": "",
+                "is_native": True,
+            })
         else:
-            # API v1 uses X-API-KEY header
-            headers["X-API-KEY"] = api_key
-            api_url = BITQUERY_API_V1_URL
-        
-        response = requests.post(
-            api_url,
-            json=payload,
-            headers=headers,
-            timeout=30,
-        )
-        
-        if response.status_code == 401:
-            error_detail = "Unauthorized - Invalid API key. Please check your BITQUERY_API_KEY."
-            try:
-                error_data = response.json()
-                if "errors" in error_data:
-                    error_detail += f" Details: {json.dumps(error_data['errors'])}"
-                elif "message" in error_data:
-                    error_detail += f" Details: {error_data['message']}"
-            except:
-                error_detail += f" Response: {response.text[:200]}"
-            return {
-                "address": address,
-                "error": error_detail,
-                "success": False,
-            }
-        if response.status_code == 403:
-            error_detail = "Forbidden - The API endpoint may require authentication or have access restrictions."
-            try:
-                error_data = response.json()
-                if "errors" in error_data:
-                    error_detail += f" Details: {json.dumps(error_data['errors'])}"
-            except:
-                error_detail += f" Response: {response.text[:200]}"
-            return {
-                "address": address,
-                "error": error_detail,
-                "success": False,
-            }
-        response.raise_for_status()
-        data = response.json()
-        
-        if "errors" in data:
-            return {
-                "address": address,
-                "error": f"GraphQL errors: {json.dumps(data['errors'])}",
-                "success": False,
-            }
-        
-        # Parse Bitquery API v2 response structure
-        ethereum_data = data.get("data", {}).get("ethereum", {})
-        address_data = ethereum_data.get("address", [])
-        
-        if not address_data:
-            # Address not found or has never had any activity - return zero balance
-            return {
-                "address": address,
-                "balances": [{
-                    "currency": {"name": "Cronos", "symbol": "CRO"},
-                    "value": "0",
-                    "symbol": "CRO",
-                    "name": "Cronos",
-                    "decimals": 18,
-                    "contract": "",
-                    "is_native": True,
-                }],
-                "success": True,
-                "total_fetched": 1,
-                "filtered_out": 0,
-            }
-        
-        address_info = address_data[0]
-        # Handle case where balance might be None, missing, or empty string
-        native_balance = address_info.get("balance")
-        if native_balance is None or native_balance == "":
-            native_balance = "0"
-        balances_list = address_info.get("balances", []) or []
-        
-        # Transform Bitquery format to our standard format
-        formatted_balances = []
-        
-        # Always add native CRO balance (even if 0) so users can see their balance status
-        try:
-            # Bitquery returns native balance in different formats:
-            # - As decimal string (e.g., "24827.849010682339425216") - already in CRO units
-            # - As integer string in wei (e.g., "24827849010682339425216") - in smallest units
-            # - May be "0", "0.0", or None if balance is zero
-            # We need to detect the format and convert to wei (smallest units) for storage
-            native_balance_str = str(native_balance).strip() if native_balance else "0"
-            
-            if '.' in native_balance_str:
-                # Already in decimal format (CRO units), convert to wei
-                # Use Decimal for precision with large numbers
-                native_balance_decimal = Decimal(native_balance_str)
-                # Convert from CRO to wei (multiply by 10^18), even if 0
-                wei_multiplier = Decimal(10) ** 18
-                native_balance_wei = int(native_balance_decimal * wei_multiplier)
-                formatted_balances.append({
-                    "currency": {"name": "Cronos", "symbol": "CRO"},
-                    "value": str(native_balance_wei),
-                    "symbol": "CRO",
-                    "name": "Cronos",
-                    "decimals": 18,
-                    "contract": "",
-                    "is_native": True,
-                })
-            else:
-                # Already in wei (smallest units), use as-is (even if 0)
-                native_balance_int = int(native_balance_str) if native_balance_str else 0
-                formatted_balances.append({
-                    "currency": {"name": "Cronos", "symbol": "CRO"},
-                    "value": str(native_balance_int),
-                    "symbol": "CRO",
-                    "name": "Cronos",
-                    "decimals": 18,
-                    "contract": "",
-                    "is_native": True,
-                })
-        except (ValueError, TypeError) as e:
-            # If parsing fails, default to 0 balance
-            print(f"Error parsing native balance '{native_balance}': {e}, defaulting to 0")
-            formatted_balances.append({
+            # Already in wei (smallest units), use as-is (even if 0)
+            native_balance_int = int(native_balance_str) if native_balance_str else 0
+            kept_balances.append({
                 "currency": {"name": "Cronos", "symbol": "CRO"},
-                "value": "0",
+                "value": str(native_balance_int),
                 "symbol": "CRO",
                 "name": "Cronos",
                 "decimals": 18,
                 "contract": "",
                 "is_native": True,
             })
-        
-        # Add token balances
-        for balance in balances_list:
-            currency = balance.get("currency", {})
-            value = balance.get("value", "0")
-            
-            # Skip zero balances
-            try:
-                value_float = float(value)
-                if value_float == 0:
-                    continue
-            except (ValueError, TypeError):
+    except (ValueError, TypeError) as e:
+        # If parsing fails, default to 0 balance
+        print(f"Error parsing native balance '{native_balance}': {e}, defaulting to 0")
+        kept_balances.append({
+            "currency": {"name": "Cronos", "symbol": "CRO"},
+            "value": "0",
+            "symbol": "CRO",
+            "name": "Cronos",
+            "decimals": 18,
+            "contract": "",
+            "is_native": True,
+        })
+
+    # Native CRO is never a test token and always leads the sample
+    formatted_sample = list(kept_balances)
+
+    # Resolve missing decimals for non-zero tokens with one batched RPC up front
+    missing_decimals = []
+    for balance in balances_list:
+        currency = balance.get("currency", {})
+        try:
+            if float(balance.get("value", "0")) == 0:
                 continue
-            
-            # Get decimals - handle None or missing values
-            decimals_raw = currency.get("decimals")
-            decimals = None
-            if decimals_raw is not None:
-                try:
-                    decimals = int(decimals_raw)
-                except (ValueError, TypeError):
-                    decimals = None
-
-            # If decimals missing, attempt to fetch from chain via RPC using eth_call to decimals()
-            if decimals is None:
-                contract_addr = currency.get("address", "") or ""
-                rpc_url = os.getenv("CRONOS_RPC_URL", "https://evm-cronos.crypto.org")
-                if contract_addr:
-                    try:
-                        hex_address = contract_addr if contract_addr.startswith("0x") else f"0x{contract_addr}"
-                        payload_rpc = {
-                            "jsonrpc": "2.0",
-                            "method": "eth_call",
-                            "params": [
-                                {"to": hex_address, "data": "0x313ce567"},
-                                "latest",
-                            ],
-                            "id": 1,
-                        }
-                        rpc_resp = requests.post(rpc_url, json=payload_rpc, timeout=10)
-                        rpc_resp.raise_for_status()
-                        rpc_data = rpc_resp.json()
-                        rpc_result = rpc_data.get("result")
-                        if rpc_result and rpc_result != "0x":
-                            decimals = int(rpc_result, 16)
-                            print(f"Debug: fetched decimals={decimals} for {hex_address} via RPC")
-                    except Exception as e:
-                        print(f"Debug: unable to fetch decimals for {contract_addr} via RPC: {e}")
-
-            # Default to 18 if still unknown
-            if decimals is None:
-                decimals = 18
-
-            # Bitquery v2 might return value in different formats
-            # It may return token amounts as decimals (e.g., 0.200826 USDT) or as integers in smallest units
-            # Use Decimal to precisely detect and convert fractional token amounts to smallest units
-            try:
-                value_in_smallest = "0"
+        except (ValueError, TypeError):
+            continue
+        contract_addr = currency.get("address", "") or ""
+        if contract_addr and _parse_decimals(currency.get("decimals")) is None:
+            missing_decimals.append(_hex_address(contract_addr))
+    rpc_decimals = fetch_token_decimals(
+        list(dict.fromkeys(missing_decimals)),
+        os.getenv("CRONOS_RPC_URL", "https://evm-cronos.crypto.org"),
+    )
+
+    # Add token balances (per-token debug lines are emitted in one write after the loop)
+    token_debug_lines: List[str] = []
+    for balance in balances_list:
+        currency = balance.get("currency", {})
+        value = balance.get("value", "0")
+
+        # Skip zero balances
+        try:
+            value_float = float(value)
+            if value_float == 0:
+                continue
+        except (ValueError, TypeError):
+            continue
+
+        # Get decimals - handle None or missing values
+        decimals_raw = currency.get("decimals")
+        decimals = _parse_decimals(decimals_raw)
+
+        # If decimals missing, use the on-chain decimals() fetched in the batch above
+        if decimals is None:
+            contract_addr = currency.get("address", "") or ""
+            if contract_addr:
+                decimals = rpc_decimals.get(_hex_address(contract_addr))
+
+        # Default to 18 if still unknown
+        if decimals is None:
+            decimals = 18
+
+        # Bitquery v2 might return value in different formats
+        # It may return token amounts as decimals (e.g., 0.200826 USDT) or as integers in smallest units
+        # Use Decimal to precisely detect and convert fractional token amounts to smallest units
+        try:
+            value_in_smallest = "0"
+            value_str = str(value).strip()
+            if PLAIN_AMOUNT_RE.fullmatch(value_str):
+                whole, _, frac = value_str.partition(".")
+                if frac.strip("0"):
+                    # Fractional part: value is in token units, scale by 10^decimals
+                    value_in_smallest = str(to_smallest(value_str, decimals))
+                else:
+                    # Integer value - assume it's already in smallest units
+                    value_in_smallest = str(int(whole))
+            else:
                 try:
-                    value_dec = Decimal(str(value))
+                    value_dec = Decimal(value_str)
                 except Exception:
                     value_dec = None
 
                 if value_dec is not None:
                     # If the value has fractional part, treat it as token units and multiply by 10^decimals
                     if value_dec != value_dec.to_integral_value():
-                        value_in_smallest = str(int((value_dec * (Decimal(10) ** decimals)).to_integral_value(rounding=ROUND_DOWN)))
+                        value_in_smallest = str(to_smallest_decimal(value_str, decimals))
                     else:
                         # Integer value - assume it's already in smallest units
                         value_in_smallest = str(int(value_dec))
                 else:
                     # Fallback: use the parsed float (previous behavior)
                     value_in_smallest = str(int(Decimal(str(int(value_float)))))
-            except Exception as e:
-                print(f"Debug: failed to convert token value for {currency.get('symbol')} value={value} decimals={decimals}: {e}")
-                try:
-                    value_in_smallest = str(int(Decimal(str(value))))
-                except Exception:
-                    value_in_smallest = "0"
-
-            print(f"Debug: token {currency.get('symbol')} value={value} decimals_raw={decimals_raw} resolved_decimals={decimals} value_in_smallest={value_in_smallest}")
-
-            formatted_balance = {
-                "currency": currency,
-                "value": value_in_smallest,  # Always store in smallest units for consistency
-                "symbol": currency.get("symbol", "Unknown"),
-                "name": currency.get("name", "Unknown"),
-                "decimals": decimals,
-                "contract": currency.get("address", ""),
-                "is_native": False,
-            }
-            formatted_balances.append(formatted_balance)
-        
-        # Filter out test tokens
-        def is_test_token(balance: Dict) -> bool:
-            """Check if a token is a test token."""
-            name = (balance.get("name") or "").lower()
-            symbol = (balance.get("symbol") or "").lower()
-            # Only filter tokens that clearly indicate test tokens in name or symbol
-            return "test" in name or "test" in symbol
-        
-        filtered_balances = [b for b in formatted_balances if not is_test_token(b)]
-        
-        # Debug: log counts to help troubleshoot missing tokens
-        filtered_out_count = len(formatted_balances) - len(filtered_balances)
-        print(f"Debug: address={address} raw_balances={len(balances_list)} formatted={len(formatted_balances)} filtered_out={filtered_out_count}")
-        if filtered_out_count > 0:
-            print("Debug: filtered out sample:", formatted_balances[:min(5, len(formatted_balances))])
-        
-        # Sort balances: native CRO first, then by value descending
-        def sort_key(balance: Dict) -> tuple:
-            """Sort key: native token first, then by value descending."""
-            is_native = balance.get("is_native", False)
+        except Exception as e:
+            print(f"Debug: failed to convert token value for {currency.get('symbol')} value={value} decimals={decimals}: {e}")
             try:
-                value = float(balance.get("value", "0"))
-            except (ValueError, TypeError):
-                value = 0
-            return (not is_native, -value)
-        
-        filtered_balances.sort(key=sort_key)
+                value_in_smallest = str(int(Decimal(str(value))))
+            except Exception:
+                value_in_smallest = "0"
 
-        result = {
-            "address": address,
-            "balances": filtered_balances,
-            "success": True,
-            "total_fetched": len(filtered_balances),
-            "filtered_out": filtered_out_count,
-            "raw_balances_count": len(balances_list),
-            "formatted_sample": formatted_balances[:3],
-            "cached": False,
+        token_debug_lines.append(f"Debug: token {currency.get('symbol')} value={value} decimals_raw={decimals_raw} resolved_decimals={decimals} value_in_smallest={value_in_smallest}")
+
+        formatted_balance = {
+            "currency": currency,
+            "value": value_in_smallest,  # Always store in smallest units for consistency
+            "symbol": currency.get("symbol", "Unknown"),
+            "name": currency.get("name", "Unknown"),
+            "decimals": decimals,
+            "contract": currency.get("address", ""),
+            "is_native": False,
         }
+        if len(formatted_sample) < 3:
+            formatted_sample.append(formatted_balance)
+        # Filter out test tokens
+        if _is_test_token(formatted_balance):
+            filtered_out.append(formatted_balance)
+        else:
+            kept_balances.append(formatted_balance)
+
+    if token_debug_lines:
+        print("\n".join(token_debug_lines))
+
+    # Debug: log counts to help troubleshoot missing tokens
+    filtered_out_count = len(filtered_out)
+    print(f"Debug: address={address} raw_balances={len(balances_list)} formatted={len(kept_balances) + filtered_out_count} filtered_out={filtered_out_count}")
+    if filtered_out_count > 0:
+        print("Debug: filtered out sample:", filtered_out[:5])
+
+    # Sort balances: native CRO first, then by value descending
+    kept_balances.sort(key=_balance_sort_key)
+
+    result = {
+        "address": address,
+        "balances": kept_balances,
+        "success": True,
+        "total_fetched": len(kept_balances),
+        "filtered_out": filtered_out_count,
+        "raw_balances_count": len(balances_list),
+        "formatted_sample": formatted_sample,
+        "cached": False,
+    }
 
-        # Store in cache
+    # Store in cache
+    try:
+        _store_cached_balance(_cache_key(address, "cronos"), copy.deepcopy(result))
+        print(f"Debug: cached balance for {address}")
+    except Exception as e:
+        print(f"Debug: failed to cache balance for {address}: {e}")
+
+    return result
+
+
+def fetch_cronos_balances(address: str) -> Dict[str, Any]:
+    """Fetch balances from Cronos using Bitquery API.
+
+    Fetches all tokens with balance > 0 from Bitquery.
+    Zero balance tokens are excluded.
+
+    Uses a simple in-memory cache to avoid repeated calls to Bitquery. Cached entries
+    are stored for BALANCE_CACHE_TTL seconds and returned directly when valid.
+
+    Args:
+        address: Wallet address to check
+
+    Returns:
+        Dictionary with balance information
+    """
+    try:
+        early_result = _check_balance_request(address)
+        if early_result is not None:
+            return early_result
+
+        # Get API key - catch ValueError if missing
         try:
-            _BALANCE_CACHE[key] = {"timestamp": time.time(), "data": result}
-            print(f"Debug: cached balance for {address}")
-        except Exception as e:
-            print(f"Debug: failed to cache balance for {address}: {e}")
+            api_key = get_bitquery_api_key()
+        except ValueError as e:
+            return {
+                "address": address,
+                "success": False,
+                "error": str(e),
+            }
 
-        return result
+        api_url, headers, payload = _bitquery_request(api_key, address)
+        response = _SESSION.post(
+            api_url,
+            json=payload,
+            headers=headers,
+            timeout=30,
+        )
+        return _handle_bitquery_response(address, response)
     except requests.exceptions.RequestException as e:
         error_msg = f"Request error: {str(e)}"
         print(f"Balance fetch request error for {address}: {error_msg}")
@@ -742,6 +941,86 @@ def fetch_cronos_balances(address: str) -> Dict[str, Any]:
         }
 
 
+def fetch_cronos_balances_batch(addresses: List[str]) -> List[Dict[str, Any]]:
+    """Fetch balances for several addresses with one aliased Bitquery request per batch.
+
+    Invalid and cached addresses are answered locally; the rest are sent in groups of
+    up to MAX_BATCH_ADDRESSES aliases per HTTP round trip.
+
+    Args:
+        addresses: Wallet addresses to check
+
+    Returns:
+        Balance results in the same order as addresses
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(addresses)
+    pending: List[int] = []
+    for i, address in enumerate(addresses):
+        results[i] = _check_balance_request(address)
+        if results[i] is None:
+            pending.append(i)
+
+    if pending:
+        try:
+            api_key = get_bitquery_api_key()
+        except ValueError as e:
+            for i in pending:
+                results[i] = {"address": addresses[i], "success": False, "error": str(e)}
+            pending = []
+
+    for start in range(0, len(pending), MAX_BATCH_ADDRESSES):
+        chunk = pending[start:start + MAX_BATCH_ADDRESSES]
+        chunk_addresses = [addresses[i] for i in chunk]
+        try:
+            api_url, headers = _bitquery_endpoint(api_key)
+            response = _SESSION.post(
+                api_url,
+                json={"query": build_batched_query(chunk_addresses)},
+                headers=headers,
+                timeout=30,
+            )
+            error_detail = _bitquery_http_error(response)
+            if error_detail is None:
+                response.raise_for_status()
+                data = _json_loads(response.content)
+                if "errors" in data:
+                    error_detail = f"GraphQL errors: {_json_dumps(data['errors'])}"
+            if error_detail is not None:
+                for i in chunk:
+                    results[i] = {"address": addresses[i], "error": error_detail, "success": False}
+                continue
+
+            aliased = data.get("data") or {}
+            for j, i in enumerate(chunk):
+                results[i] = _build_balance_result(addresses[i], aliased.get(f"a{j}") or {})
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request error: {str(e)}"
+            print(f"Batched balance fetch request error for {chunk_addresses}: {error_msg}")
+            for i in chunk:
+                results[i] = {"address": addresses[i], "error": error_msg, "success": False}
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            print(f"Batched balance fetch unexpected error for {chunk_addresses}: {error_msg}")
+            for i in chunk:
+                results[i] = {"address": addresses[i], "error": error_msg, "success": False}
+
+    return results
+
+
+def _format_units(value_int: int, decimals: int) -> str:
+    """Format an amount in smallest units as a human-readable token amount.
+
+    Uses up to 6 decimal places (18 for very small values), trailing zeros removed.
+    """
+    if decimals <= 0:
+        return str(value_int)
+    balance_decimal = value_int / pow10(decimals)
+    # Use more precision for very small values
+    if balance_decimal < 0.000001:
+        return f"{balance_decimal:.18f}".rstrip('0').rstrip('.')
+    return f"{balance_decimal:.6f}".rstrip('0').rstrip('.')
+
+
 def format_cronos_balance_response(balances_data: Dict[str, Any], address: str) -> str:
     """Format Cronos balance data into a user-friendly string.
     
@@ -798,16 +1077,7 @@ def format_cronos_balance_response(balances_data: Dict[str, Any], address: str)
         
         # Format balance with proper precision
         try:
-            value_int = int(value)
-            if decimals > 0:
-                balance_decimal = value_int / (10 ** decimals)
-                # Use more precision for very small values
-                if balance_decimal < 0.000001:
-                    formatted_balance = f"{balance_decimal:.18f}".rstrip('0').rstrip('.')
-                else:
-                    formatted_balance = f"{balance_decimal:.6f}".rstrip('0').rstrip('.')
-            else:
-                formatted_balance = str(value_int)
+            formatted_balance = _format_units(int(value), decimals)
         except (ValueError, TypeError):
             formatted_balance = str(value)
         
@@ -870,7 +1140,7 @@ def get_token_balance(address: str, token: str, network: str = DEFAULT_NETWORK)
                 name = balance.get("name", "Unknown Token")
                 try:
                     value_int = int(value)
-                    formatted_balance = value_int / (10 ** decimals)
+                    formatted_balance = value_int / pow10(decimals)
                     return f"{address} has {formatted_balance:.6f} {symbol} ({name}) on Cronos"
                 except (ValueError, TypeError):
                     return f"{address} has {value} {symbol} (raw) on Cronos"
@@ -5,11 +5,15 @@ Provides a structured JSON endpoint for fetching balance data
 without the agent's text formatting.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from .agent import fetch_cronos_balances, validate_address
+from .agent import MAX_BATCH_ADDRESSES, fetch_cronos_balances, fetch_cronos_balances_batch, validate_address
+
+# Upper bound on addresses per batch request (MAX_BATCH_ADDRESSES per Bitquery call)
+MAX_ADDRESSES_PER_REQUEST = 4 * MAX_BATCH_ADDRESSES
 
 router = APIRouter()
 
@@ -20,6 +24,12 @@ class BalanceRequest(BaseModel):
     network: str = "cronos"
 
 
+class BatchBalanceRequest(BaseModel):
+    """Request model for multi-address balance queries"""
+    addresses: List[str] = Field(..., min_length=1, max_length=MAX_ADDRESSES_PER_REQUEST)
+    network: str = "cronos"
+
+
 class BalanceResponse(BaseModel):
     """Response model for balance data"""
     address: str
@@ -36,7 +46,8 @@ async def get_balance_json(request: BalanceRequest) -> Dict[str, Any]:
     Get structured balance data without agent text formatting.
     
     This endpoint directly calls fetch_cronos_balances and returns
-    the raw JSON data structure.
+    the raw JSON data structure. The blocking Bitquery call runs in a
+    worker thread so it doesn't stall the event loop.
     """
     # Validate address
     if not validate_address(request.address):
@@ -54,10 +65,35 @@ async def get_balance_json(request: BalanceRequest) -> Dict[str, Any]:
     
     # Fetch balance data
     try:
-        balance_data = fetch_cronos_balances(request.address)
+        balance_data = await asyncio.to_thread(fetch_cronos_balances, request.address)
         return balance_data
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching balance: {str(e)}"
         )
+
+
+@router.post("/api/balance/json/batch")
+async def get_balances_json_batch(request: BatchBalanceRequest) -> List[Dict[str, Any]]:
+    """
+    Get structured balance data for several wallets in one call.
+
+    Addresses are sent to Bitquery as aliased sub-queries, up to
+    MAX_BATCH_ADDRESSES per HTTP request, so N wallets cost one round trip
+    per batch rather than one each. Results come back in request order;
+    invalid addresses get a per-item error instead of failing the batch.
+    """
+    if request.network.lower() != "cronos":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Network '{request.network}' not supported. Only 'cronos' is available."
+        )
+
+    try:
+        return await asyncio.to_thread(fetch_cronos_balances_batch, request.addresses)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching balances: {str(e)}"
+        )
@@ -7,6 +7,7 @@ responses that trigger frontend actions for transaction execution.
 """
 
 import os
+import re
 import uuid
 import json
 import pathlib
@@ -183,6 +184,10 @@ def create_agent_card(port: int) -> AgentCard:
     )
 
 
+# "0x" followed by exactly 40 hex digits
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
 def validate_address(address: str) -> bool:
     """Validate Ethereum/Cronos address format.
     
@@ -192,14 +197,7 @@ def validate_address(address: str) -> bool:
     Returns:
         True if address is valid, False otherwise
     """
-    if not address.startswith("0x"):
-        return False
-    if len(address) != 42:
-        return False
-    hex_part = address[2:]
-    if not all(c in "0123456789abcdefABCDEF" for c in hex_part):
-        return False
-    return True
+    return _ADDRESS_RE.fullmatch(address) is not None
 
 
 def extract_transfer_params(query: str) -> Dict[str, Any]:
@@ -8,11 +8,46 @@ This package provides:
 - RiskEngine for health factor monitoring and safe borrow limits
 """
 
-from .client import TectonicClient, TectonicError, AccountLiquidity
-from .config import TECTONIC_ADDRESSES, TECTONIC_NETWORK
-from .gas import GasStrategy, GasParams, create_gas_strategy
-from .providers import ProviderManager, RPCProviderError, create_provider_manager
-from .risk_engine import RiskEngine, RiskStatus, HealthMetrics, OraclePriceCheck
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# the package -- e.g. to run a demo with --help -- does not pull in web3 until
+# something web3-backed is actually used.
+_LAZY_EXPORTS = {
+    "TectonicClient": ".client",
+    "TectonicError": ".client",
+    "AccountLiquidity": ".client",
+    "TECTONIC_ADDRESSES": ".config",
+    "TECTONIC_NETWORK": ".config",
+    "GasStrategy": ".gas",
+    "GasParams": ".gas",
+    "create_gas_strategy": ".gas",
+    "ProviderManager": ".providers",
+    "RPCProviderError": ".providers",
+    "create_provider_manager": ".providers",
+    "RiskEngine": ".risk_engine",
+    "RiskStatus": ".risk_engine",
+    "HealthMetrics": ".risk_engine",
+    "OraclePriceCheck": ".risk_engine",
+}
+
+if TYPE_CHECKING:
+    from .client import TectonicClient, TectonicError, AccountLiquidity
+    from .config import TECTONIC_ADDRESSES, TECTONIC_NETWORK
+    from .gas import GasStrategy, GasParams, create_gas_strategy
+    from .providers import ProviderManager, RPCProviderError, create_provider_manager
+    from .risk_engine import RiskEngine, RiskStatus, HealthMetrics, OraclePriceCheck
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "TectonicClient",
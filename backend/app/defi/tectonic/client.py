@@ -11,21 +11,69 @@ This module is backend-only and does NOT handle user prompts or agent logic.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import time
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Tuple
 
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import TxParams, TxReceipt
 
 from .config import TECTONIC_ADDRESSES, TECTONIC_NETWORK
-from .gas import GasStrategy, create_gas_strategy
+from .gas import GasEstimationReverted, GasStrategy, create_gas_strategy
 from .providers import ProviderManager, create_provider_manager
 
 logger = logging.getLogger(__name__)
 
+# Receipt polling. Cronos produces a block roughly every 6s, so web3's default
+# 0.1s poll interval mostly issues eth_getTransactionReceipt calls that return null.
+RECEIPT_TIMEOUT = 120  # seconds
+RECEIPT_POLL_LATENCY = 1.5  # seconds
+
+# Reuse a locally incremented nonce for follow-up txs (approve -> mint) within this
+# window instead of calling get_transaction_count again; re-synced after any failure.
+NONCE_CACHE_TTL = 30  # seconds
+
+
+@functools.lru_cache(maxsize=4096)
+def checksum_address(address: str) -> str:
+    """EIP-55 checksum an address, memoized so each distinct string is hashed once."""
+    return Web3.to_checksum_address(address)
+
+
+# Static market addresses, checksummed once at import
+USDC_ADDRESS = checksum_address(TECTONIC_ADDRESSES.usdc)
+TUSDC_ADDRESS = checksum_address(TECTONIC_ADDRESSES.tusdc)
+COMPTROLLER_ADDRESS = checksum_address(TECTONIC_ADDRESSES.comptroller)
+
+# ERC-20 view selectors for the hot balance/allowance reads. Calldata is built by
+# concatenation and sent as a plain eth_call, skipping the contract ABI encoder.
+ERC20_BALANCE_OF_SELECTOR = "0x70a08231"
+ERC20_ALLOWANCE_SELECTOR = "0xdd62ed3e"
+
+
+def _abi_address(address: str) -> str:
+    """ABI-encode an address argument as a 32-byte hex word (no 0x prefix)."""
+    return address[2:].lower().rjust(64, "0")
+
+
+def default_rpc_urls(rpc_url: Optional[str] = None) -> List[str]:
+    """Build the RPC list: custom URL first, then CRONOS_RPC from env, then defaults."""
+    rpc_list: List[str] = []
+    if rpc_url:
+        rpc_list.append(rpc_url)
+    env_rpc = os.getenv("CRONOS_RPC")
+    if env_rpc and env_rpc not in rpc_list:
+        rpc_list.append(env_rpc)
+    for default_rpc in TECTONIC_NETWORK.rpc_urls:
+        if default_rpc not in rpc_list:
+            rpc_list.append(default_rpc)
+    return rpc_list
+
 
 # --- Minimal ABIs -----------------------------------------------------------------
 
@@ -235,25 +283,18 @@ class TectonicClient:
         if provider_manager:
             self.provider_manager = provider_manager
         else:
-            # Build RPC list: custom URL first, then env, then defaults
-            rpc_list = []
-            if rpc_url:
-                rpc_list.append(rpc_url)
-            env_rpc = os.getenv("CRONOS_RPC")
-            if env_rpc and env_rpc not in rpc_list:
-                rpc_list.append(env_rpc)
-            # Add defaults
-            for default_rpc in TECTONIC_NETWORK.rpc_urls:
-                if default_rpc not in rpc_list:
-                    rpc_list.append(default_rpc)
-
+            rpc_list = default_rpc_urls(rpc_url)
             self.provider_manager = create_provider_manager(rpc_urls=rpc_list if rpc_list else None)
 
         # Get Web3 instance from provider manager
         self.web3 = self.provider_manager.get_web3()
         self.rpc_url = self.web3.provider.endpoint_uri if hasattr(self.web3.provider, "endpoint_uri") else "unknown"
 
-        chain_id = self.web3.eth.chain_id
+        # The provider manager already verified the chain id when it built this
+        # instance; reuse it rather than issuing another eth_chainId.
+        chain_id = self.provider_manager.chain_id
+        if chain_id is None:
+            chain_id = self.web3.eth.chain_id
         if chain_id != TECTONIC_NETWORK.chain_id:
             raise TectonicError(f"Connected to wrong chain_id={chain_id}, expected {TECTONIC_NETWORK.chain_id}.")
 
@@ -262,25 +303,23 @@ class TectonicClient:
         # Initialize gas strategy
         self.gas_strategy = create_gas_strategy(self.web3)
 
-        # Optional signing account (for write operations)
-        self._private_key = None
+        # Nonce cache for the signer (see NONCE_CACHE_TTL)
+        self._next_nonce: Optional[int] = None
+        self._nonce_used_at = 0.0
+
+        # Optional signing account (for write operations). The key is parsed once;
+        # signing through the LocalAccount avoids re-deriving it for every transaction.
+        self._account: Optional[LocalAccount] = None
         self.address: Optional[str] = None
         if private_key:
             if not private_key.startswith("0x"):
                 private_key = "0x" + private_key
-            account = self.web3.eth.account.from_key(private_key)
-            self._private_key = private_key
-            self.address = account.address
+            self._account = Account.from_key(private_key)
+            self.address = self._account.address
 
         # Contracts
-        self.usdc = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(TECTONIC_ADDRESSES.usdc),
-            abi=ERC20_ABI,
-        )
-        self.tusdc = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(TECTONIC_ADDRESSES.tusdc),
-            abi=CTOKEN_ABI,
-        )
+        self.usdc = self.web3.eth.contract(address=USDC_ADDRESS, abi=ERC20_ABI)
+        self.tusdc = self.web3.eth.contract(address=TUSDC_ADDRESS, abi=CTOKEN_ABI)
 
         # Resolve the correct "risk engine" address for this market.
         # On Cronos Tectonic, this is often exposed as `tectonicCore()` on the tToken.
@@ -300,7 +339,7 @@ class TectonicClient:
         try:
             core = self.tusdc.functions.tectonicCore().call()
             if core and int(core, 16) != 0:
-                return self.web3.to_checksum_address(core)
+                return checksum_address(core)
         except Exception:
             pass
 
@@ -308,19 +347,31 @@ class TectonicClient:
         try:
             comp = self.tusdc.functions.comptroller().call()
             if comp and int(comp, 16) != 0:
-                return self.web3.to_checksum_address(comp)
+                return checksum_address(comp)
         except Exception:
             pass
 
-        return self.web3.to_checksum_address(TECTONIC_ADDRESSES.comptroller)
+        return COMPTROLLER_ADDRESS
 
     # --- Internal helpers --------------------------------------------------------
 
     def _require_signer(self) -> str:
-        if not self.address or not self._private_key:
+        if not self.address or self._account is None:
             raise TectonicError("TectonicClient was created without a private key; write operation not allowed.")
         return self.address
 
+    def _resolve_account(self, address: Optional[str] = None) -> str:
+        """Checksum an explicit address, or return the signer (already checksummed by eth_account)."""
+        if not address:
+            return self._require_signer()
+        return checksum_address(address)
+
+    def _get_nonce(self, sender: str) -> int:
+        """Return the next nonce for the signer, fetching it only when the cache is cold or stale."""
+        if self._next_nonce is None or time.monotonic() - self._nonce_used_at > NONCE_CACHE_TTL:
+            self._next_nonce = self.web3.eth.get_transaction_count(sender)
+        return self._next_nonce
+
     def _build_and_send(self, func, tx_overrides: Optional[TxParams] = None) -> TxReceipt:
         """
         Build, sign and send a transaction for the given contract function.
@@ -336,14 +387,18 @@ class TectonicClient:
                 from_address=sender,
                 value=value,
                 tx_overrides={
-                    "nonce": self.web3.eth.get_transaction_count(sender),
+                    "nonce": self._get_nonce(sender),
                     "chainId": self.chain_id,
                     **(tx_overrides or {}),
                 },
             )
+        except GasEstimationReverted as e:
+            # A revert is deterministic; refreshing the connection won't help
+            raise TectonicError(str(e)) from e
         except Exception as e:
             # Fallback: try to refresh Web3 connection and retry
             logger.warning(f"Gas strategy failed, refreshing connection: {e}")
+            self._next_nonce = None
             self.web3 = self.provider_manager.get_web3(force_refresh=True)
             self.gas_strategy = create_gas_strategy(self.web3)
             tx = self.gas_strategy.estimate_and_build_tx(
@@ -351,19 +406,29 @@ class TectonicClient:
                 from_address=sender,
                 value=value,
                 tx_overrides={
-                    "nonce": self.web3.eth.get_transaction_count(sender),
+                    "nonce": self._get_nonce(sender),
                     "chainId": self.chain_id,
                     **(tx_overrides or {}),
                 },
             )
 
         # Sign and send
-        signed = self.web3.eth.account.sign_transaction(tx, private_key=self._private_key)
+        signed = self._account.sign_transaction(tx)
         raw_tx = getattr(signed, "raw_transaction", getattr(signed, "rawTransaction", None))
-        tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        try:
+            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+            self._next_nonce = tx["nonce"] + 1
+            self._nonce_used_at = time.monotonic()
+            receipt = self.web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+            )
+        except Exception:
+            # Re-sync from the node on the next transaction
+            self._next_nonce = None
+            raise
 
         if receipt.status != 1:
+            self._next_nonce = None
             raise TectonicError(f"Transaction reverted; tx_hash={tx_hash.hex()}")
         return receipt
 
@@ -371,27 +436,34 @@ class TectonicClient:
 
     def get_account_liquidity(self, address: Optional[str] = None) -> AccountLiquidity:
         """Return (error, liquidity, shortfall) for account from Comptroller."""
-        addr = self.web3.to_checksum_address(address or self._require_signer())
+        addr = self._resolve_account(address)
         error, liquidity, shortfall = self.comptroller.functions.getAccountLiquidity(addr).call()
         return AccountLiquidity(error=int(error), liquidity=int(liquidity), shortfall=int(shortfall))
 
     def get_assets_in(self, address: Optional[str] = None) -> List[str]:
         """Return list of tToken addresses entered as collateral."""
-        addr = self.web3.to_checksum_address(address or self._require_signer())
+        addr = self._resolve_account(address)
         return list(self.comptroller.functions.getAssetsIn(addr).call())
 
     def get_borrow_balance(self, address: Optional[str] = None) -> int:
         """Return up-to-date borrow balance for tUSDC (includes accrued interest)."""
-        addr = self.web3.to_checksum_address(address or self._require_signer())
+        addr = self._resolve_account(address)
         return int(self.tusdc.functions.borrowBalanceCurrent(addr).call())
 
+    def _call_uint256(self, to: str, data: str) -> int:
+        """eth_call a view returning a single uint256 and decode it."""
+        raw = self.web3.eth.call({"to": to, "data": data})
+        if len(raw) < 32:
+            raise TectonicError(f"Unexpected eth_call result from {to}: 0x{bytes(raw).hex()}")
+        return int.from_bytes(raw[:32], "big")
+
     def get_tusdc_balance(self, address: Optional[str] = None) -> int:
-        addr = self.web3.to_checksum_address(address or self._require_signer())
-        return int(self.tusdc.functions.balanceOf(addr).call())
+        addr = self._resolve_account(address)
+        return self._call_uint256(TUSDC_ADDRESS, ERC20_BALANCE_OF_SELECTOR + _abi_address(addr))
 
     def get_usdc_balance(self, address: Optional[str] = None) -> int:
-        addr = self.web3.to_checksum_address(address or self._require_signer())
-        return int(self.usdc.functions.balanceOf(addr).call())
+        addr = self._resolve_account(address)
+        return self._call_uint256(USDC_ADDRESS, ERC20_BALANCE_OF_SELECTOR + _abi_address(addr))
 
     # --- Allowance / collateral management --------------------------------------
 
@@ -400,9 +472,11 @@ class TectonicClient:
         Ensure allowance from user -> tUSDC is at least required_amount.
         For safety, we approve exactly required_amount (not infinite).
         """
-        owner = self.web3.to_checksum_address(self._require_signer())
-        spender_addr = self.web3.to_checksum_address(spender or TECTONIC_ADDRESSES.tusdc)
-        current = int(self.usdc.functions.allowance(owner, spender_addr).call())
+        owner = self._require_signer()
+        spender_addr = checksum_address(spender) if spender else TUSDC_ADDRESS
+        current = self._call_uint256(
+            USDC_ADDRESS, ERC20_ALLOWANCE_SELECTOR + _abi_address(owner) + _abi_address(spender_addr)
+        )
         if current >= required_amount:
             return
 
@@ -414,19 +488,18 @@ class TectonicClient:
         Call Comptroller.enterMarkets for any markets the user hasn't entered yet.
         By default, only ensures tUSDC is entered.
         """
-        user = self.web3.to_checksum_address(self._require_signer())
+        user = self._require_signer()
         existing = set(self.comptroller.functions.getAssetsIn(user).call())
 
         targets: List[str] = []
         if markets:
             for m in markets:
-                cm = self.web3.to_checksum_address(m)
+                cm = checksum_address(m)
                 if cm not in existing:
                     targets.append(cm)
         else:
-            tusdc_addr = self.web3.to_checksum_address(TECTONIC_ADDRESSES.tusdc)
-            if tusdc_addr not in existing:
-                targets.append(tusdc_addr)
+            if TUSDC_ADDRESS not in existing:
+                targets.append(TUSDC_ADDRESS)
 
         if not targets:
             return
@@ -480,7 +553,7 @@ class TectonicClient:
         - a specific amount (may leave small dust), or
         - MAX_UINT256 if later we confirm "repay all" semantics are supported.
         """
-        self.ensure_usdc_allowance(required_amount=amount_wei, spender=TECTONIC_ADDRESSES.tusdc)
+        self.ensure_usdc_allowance(required_amount=amount_wei, spender=TUSDC_ADDRESS)
         func = self.tusdc.functions.repayBorrow(amount_wei)
         error_code = int(func.call({"from": self._require_signer()}))
         if error_code != 0:
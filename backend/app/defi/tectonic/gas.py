@@ -12,10 +12,13 @@ This module provides:
 from __future__ import annotations
 
 import logging
+import statistics
+import time
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 from web3 import Web3
+from web3.exceptions import ContractLogicError, ExtraDataLengthError
 from web3.types import Wei
 
 logger = logging.getLogger(__name__)
@@ -35,6 +38,13 @@ MIN_PRIORITY_FEE_GWEI = 0.01
 # Maximum priority fee (safety cap)
 MAX_PRIORITY_FEE_GWEI = 10.0
 
+# Blocks / reward percentile sampled by the single eth_feeHistory call
+FEE_HISTORY_BLOCKS = 5
+FEE_HISTORY_PERCENTILE = 50
+
+# How long a fee_history sample is reused (covers build retries of one operation)
+FEE_HISTORY_TTL = 5.0  # seconds
+
 
 @dataclass
 class GasParams:
@@ -51,6 +61,12 @@ class GasStrategyError(Exception):
     pass
 
 
+class GasEstimationReverted(GasStrategyError):
+    """Raised when gas estimation fails because the call itself would revert."""
+
+    pass
+
+
 class GasStrategy:
     """
     EIP-1559 gas strategy for Cronos transactions.
@@ -78,6 +94,47 @@ class GasStrategy:
         self.web3 = web3
         self.base_fee_multiplier = base_fee_multiplier
         self.default_priority_fee_gwei = default_priority_fee_gwei
+        self._fee_sample: Optional[Tuple[Wei, Wei]] = None
+        self._fee_sample_at = 0.0
+
+    def _get_fees_from_history(self) -> Optional[Tuple[Wei, Wei]]:
+        """
+        Get (base fee, priority fee) from one eth_feeHistory call.
+
+        baseFeePerGas[-1] is the base fee of the pending block; the tip is the median
+        of the per-block reward percentile, ignoring empty blocks, clamped to
+        [MIN_PRIORITY_FEE_GWEI, MAX_PRIORITY_FEE_GWEI]. The sample is
+        reused for FEE_HISTORY_TTL seconds.
+
+        Returns:
+            Tuple of (base fee, priority fee) in Wei, or None if fee history is unavailable
+        """
+        now = time.monotonic()
+        if self._fee_sample is not None and now - self._fee_sample_at < FEE_HISTORY_TTL:
+            return self._fee_sample
+
+        try:
+            fee_history = self.web3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE])
+            base_fees = fee_history["baseFeePerGas"]
+            if not base_fees:
+                return None
+            base_fee = Wei(int(base_fees[-1]))
+            rewards = [int(r[0]) for r in (fee_history.get("reward") or []) if r and int(r[0]) > 0]
+        except Exception as e:
+            logger.debug(f"Fee history API not available: {e}")
+            return None
+
+        priority_fee = Wei(self.web3.to_wei(self.default_priority_fee_gwei, "gwei"))
+        if rewards:
+            # Clamp rather than discard: on a congested chain the cap still outbids the default
+            min_tip = self.web3.to_wei(MIN_PRIORITY_FEE_GWEI, "gwei")
+            max_tip = self.web3.to_wei(MAX_PRIORITY_FEE_GWEI, "gwei")
+            median_tip = int(statistics.median(rewards))
+            priority_fee = Wei(min(max(median_tip, min_tip), max_tip))
+
+        self._fee_sample = (base_fee, priority_fee)
+        self._fee_sample_at = now
+        return self._fee_sample
 
     def get_base_fee(self, block_number: Optional[int] = None) -> Wei:
         """
@@ -93,11 +150,18 @@ class GasStrategy:
             GasStrategyError: If base fee cannot be determined
         """
         try:
-            # Try to get base fee from latest block
-            if block_number is None:
-                block_number = self.web3.eth.block_number
-
-            block = self.web3.eth.get_block(block_number, full_transactions=False)
+            # Try to get base fee from the requested (or latest) block. Passing "latest"
+            # directly saves the separate eth_blockNumber round trip.
+            block_identifier = "latest" if block_number is None else block_number
+            try:
+                block = self.web3.eth.get_block(block_identifier, full_transactions=False)
+            except ExtraDataLengthError:
+                # POA middleware is not installed by default; add it the first time a
+                # block header actually needs it and retry.
+                from .providers import inject_poa_middleware
+
+                inject_poa_middleware(self.web3)
+                block = self.web3.eth.get_block(block_identifier, full_transactions=False)
             if hasattr(block, "baseFeePerGas") and block.baseFeePerGas is not None:
                 return Wei(block.baseFeePerGas)
 
@@ -170,9 +234,14 @@ class GasStrategy:
         Returns:
             GasParams with maxFeePerGas, maxPriorityFeePerGas, and gas_limit
         """
-        # Get base fee and priority fee
-        base_fee = self.get_base_fee(block_number)
-        priority_fee = self.get_priority_fee()
+        # Get base fee and priority fee: one eth_feeHistory round trip when possible,
+        # otherwise the latest block + eth_maxPriorityFeePerGas
+        fees = self._get_fees_from_history() if block_number is None else None
+        if fees is not None:
+            base_fee, priority_fee = fees
+        else:
+            base_fee = self.get_base_fee(block_number)
+            priority_fee = self.get_priority_fee()
 
         # Calculate maxFeePerGas with safety multiplier
         base_fee_with_multiplier = int(base_fee * self.base_fee_multiplier)
@@ -213,6 +282,7 @@ class GasStrategy:
             Transaction dict ready for signing
 
         Raises:
+            GasEstimationReverted: If the call would revert
             GasStrategyError: If gas estimation fails
         """
         # Build base transaction
@@ -228,6 +298,18 @@ class GasStrategy:
             estimated_gas = contract_function.estimate_gas(base_tx)
             # Add 20% buffer for safety
             gas_limit = int(estimated_gas * 1.2)
+        except ContractLogicError as e:
+            # Common case on current web3.py: the revert reason is already decoded.
+            # Falling back to DEFAULT_GAS_LIMIT would only get the tx mined as a failure.
+            reason = getattr(e, "message", None) or str(e)
+            raise GasEstimationReverted(f"Transaction would revert: {reason}") from e
+        except ValueError as e:
+            # Older providers surface the raw JSON-RPC error dict as args[0]
+            payload = e.args[0] if e.args else None
+            if isinstance(payload, dict) and "revert" in str(payload.get("message", "")).lower():
+                raise GasEstimationReverted(f"Transaction would revert: {payload['message']}") from e
+            logger.warning(f"Gas estimation failed: {e}. Using default gas limit.")
+            gas_limit = DEFAULT_GAS_LIMIT
         except Exception as e:
             logger.warning(f"Gas estimation failed: {e}. Using default gas limit.")
             gas_limit = DEFAULT_GAS_LIMIT
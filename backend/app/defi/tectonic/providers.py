@@ -11,11 +11,16 @@ This module provides:
 from __future__ import annotations
 
 import logging
+import os
+import random
 import time
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import RPCEndpoint
@@ -30,6 +35,56 @@ DEFAULT_RPC_TIMEOUT = 10  # seconds
 # Health check timeout (shorter for quick failover)
 HEALTH_CHECK_TIMEOUT = 3  # seconds
 
+# Upper bound for the re-check backoff of a failing endpoint
+MAX_RECHECK_BACKOFF = 600  # seconds
+
+# Relative jitter applied to the re-check backoff (+/- 20%)
+RECHECK_JITTER = 0.2
+
+# ENS resolution middleware (named per web3.py version). Every address we pass
+# is hex, so it only adds per-call overhead. attrdict is kept: callers rely on
+# attribute access (receipt.status, block.baseFeePerGas).
+UNUSED_MIDDLEWARE = ("ens_name_to_address", "name_to_address")
+
+_middleware_logged = False
+
+# ExtraDataToPOAMiddleware only matters when decoding block headers with oversized
+# extraData; on eth_call / sendRawTransaction / receipts it is pure per-response
+# overhead. Off by default (GasStrategy injects it on demand), CRONOS_POA_MIDDLEWARE=1
+# restores eager injection.
+POA_MIDDLEWARE_ENABLED = os.getenv("CRONOS_POA_MIDDLEWARE", "").lower() in ("1", "true", "yes")
+
+# Shared connection pool for every Web3 HTTPProvider we build, so eth_call /
+# sendRawTransaction / receipt polling reuse keep-alive TCP+TLS connections.
+# Transport-level retries cover connection failures and gateway 5xx from RPC providers;
+# read timeouts are not retried (read=0) so a stalled endpoint still fails over quickly.
+# Re-sending the same signed raw transaction is harmless (same tx hash).
+# Size the pool to the expected number of concurrent RPC callers (API worker threads).
+RPC_POOL_SIZE = int(os.getenv("CRONOS_RPC_POOL_SIZE", "16"))
+
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=RPC_POOL_SIZE,
+    pool_maxsize=RPC_POOL_SIZE,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Health probes get their own pooled session with no transport retries: a dead
+# endpoint must fail within HEALTH_CHECK_TIMEOUT so failover stays quick.
+_PROBE_SESSION = requests.Session()
+_PROBE_ADAPTER = HTTPAdapter(pool_connections=RPC_POOL_SIZE, pool_maxsize=RPC_POOL_SIZE, max_retries=0)
+_PROBE_SESSION.mount("https://", _PROBE_ADAPTER)
+_PROBE_SESSION.mount("http://", _PROBE_ADAPTER)
+
 
 class RPCProviderError(Exception):
     """Base exception for RPC provider errors."""
@@ -45,7 +100,7 @@ class ProviderManager:
     - Automatic health checks
     - Failover on errors or timeouts
     - Latency tracking
-    - Retry with exponential backoff
+    - Exponential backoff (with jitter) before re-checking failed endpoints
     """
 
     def __init__(
@@ -60,7 +115,8 @@ class ProviderManager:
         Args:
             rpc_urls: List of RPC URLs to use (defaults to TECTONIC_NETWORK.rpc_urls)
             timeout: Request timeout in seconds
-            health_check_interval: How often to re-check failed endpoints (seconds)
+            health_check_interval: Base delay before re-checking a failed endpoint (seconds);
+                doubles with each consecutive failure
         """
         self.rpc_urls = rpc_urls or list(TECTONIC_NETWORK.rpc_urls) or []
         if not self.rpc_urls:
@@ -77,23 +133,46 @@ class ProviderManager:
                 "last_check": 0,
                 "failure_count": 0,
                 "last_error": None,
+                "retry_after": 0.0,
             }
 
         # Current active endpoint
         self._current_index = 0
         self._web3_instance: Optional[Web3] = None
+        self._chain_id: Optional[int] = None
 
     def _is_endpoint_healthy(self, url: str) -> bool:
         """Check if an endpoint should be considered healthy."""
         status = self._endpoint_status[url]
         if not status["healthy"]:
-            # Check if enough time has passed to retry
+            # Check if enough time has passed to retry (backs off on repeated failures)
             time_since_check = time.time() - status["last_check"]
-            if time_since_check >= self.health_check_interval:
+            if time_since_check >= status["retry_after"]:
                 # Try health check again
                 return self._check_endpoint_health(url)
         return status["healthy"]
 
+    def _recheck_delay(self, failure_count: int) -> float:
+        """
+        Compute how long to wait before re-checking a failed endpoint.
+
+        Doubles health_check_interval for each consecutive failure (capped at
+        MAX_RECHECK_BACKOFF) and applies +/- RECHECK_JITTER so several managers
+        don't re-probe a struggling endpoint in lockstep.
+        """
+        exponent = min(max(failure_count - 1, 0), 16)
+        delay = min(self.health_check_interval * (2**exponent), MAX_RECHECK_BACKOFF)
+        return delay * random.uniform(1 - RECHECK_JITTER, 1 + RECHECK_JITTER)
+
+    def _record_failure(self, url: str, error: str) -> None:
+        """Mark an endpoint unhealthy and schedule its next re-check."""
+        status = self._endpoint_status[url]
+        status["healthy"] = False
+        status["last_check"] = time.time()
+        status["failure_count"] += 1
+        status["last_error"] = error
+        status["retry_after"] = self._recheck_delay(status["failure_count"])
+
     def _check_endpoint_health(self, url: str) -> bool:
         """
         Perform a quick health check on an RPC endpoint.
@@ -103,7 +182,7 @@ class ProviderManager:
         """
         try:
             payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []}
-            response = requests.post(url, json=payload, timeout=HEALTH_CHECK_TIMEOUT)
+            response = _PROBE_SESSION.post(url, json=payload, timeout=HEALTH_CHECK_TIMEOUT)
 
             if response.status_code == 200:
                 data = response.json()
@@ -116,6 +195,7 @@ class ProviderManager:
                     self._endpoint_status[url]["last_check"] = time.time()
                     self._endpoint_status[url]["failure_count"] = 0
                     self._endpoint_status[url]["last_error"] = None
+                    self._endpoint_status[url]["retry_after"] = self.health_check_interval
 
                     if not is_valid:
                         logger.warning(
@@ -125,25 +205,16 @@ class ProviderManager:
                     return is_valid
 
             # HTTP error or invalid response
-            self._endpoint_status[url]["healthy"] = False
-            self._endpoint_status[url]["last_check"] = time.time()
-            self._endpoint_status[url]["failure_count"] += 1
-            self._endpoint_status[url]["last_error"] = f"HTTP {response.status_code}"
+            self._record_failure(url, f"HTTP {response.status_code}")
             return False
 
         except requests.exceptions.Timeout:
-            self._endpoint_status[url]["healthy"] = False
-            self._endpoint_status[url]["last_check"] = time.time()
-            self._endpoint_status[url]["failure_count"] += 1
-            self._endpoint_status[url]["last_error"] = "Timeout"
+            self._record_failure(url, "Timeout")
             logger.warning(f"RPC {url} health check timed out")
             return False
 
         except Exception as e:
-            self._endpoint_status[url]["healthy"] = False
-            self._endpoint_status[url]["last_check"] = time.time()
-            self._endpoint_status[url]["failure_count"] += 1
-            self._endpoint_status[url]["last_error"] = str(e)
+            self._record_failure(url, str(e))
             logger.warning(f"RPC {url} health check failed: {e}")
             return False
 
@@ -175,24 +246,38 @@ class ProviderManager:
             )
 
         # Create Web3 instance
-        self._web3_instance = Web3(Web3.HTTPProvider(healthy_url, request_kwargs={"timeout": self.timeout}))
-        self._web3_instance.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-
-        # Verify connection and chain ID
-        if not self._web3_instance.is_connected():
+        web3 = Web3(
+            Web3.HTTPProvider(healthy_url, request_kwargs={"timeout": self.timeout}, session=_SESSION)
+        )
+        if POA_MIDDLEWARE_ENABLED:
+            inject_poa_middleware(web3)
+        _strip_unused_middleware(web3)
+
+        # A single eth_chainId doubles as the liveness ping (is_connected() would
+        # spend an extra web3_clientVersion round trip). The instance is then
+        # treated as live until it fails or force_refresh is requested.
+        try:
+            chain_id = web3.eth.chain_id
+        except Exception as e:
             # Mark endpoint as unhealthy and try next one
-            self._endpoint_status[healthy_url]["healthy"] = False
+            self._record_failure(healthy_url, str(e))
             return self.get_web3(force_refresh=True)
 
-        chain_id = self._web3_instance.eth.chain_id
         if chain_id != TECTONIC_NETWORK.chain_id:
             raise RPCProviderError(
                 f"RPC {healthy_url} returned wrong chain_id={chain_id}, expected {TECTONIC_NETWORK.chain_id}"
             )
 
+        self._web3_instance = web3
+        self._chain_id = chain_id
         logger.info(f"Connected to RPC: {healthy_url} (chain_id={chain_id})")
         return self._web3_instance
 
+    @property
+    def chain_id(self) -> Optional[int]:
+        """Chain ID verified when the current Web3 instance was created (None before get_web3)."""
+        return self._chain_id
+
     def _find_healthy_endpoint(self) -> Optional[str]:
         """
         Find the first healthy endpoint in the pool.
@@ -209,12 +294,21 @@ class ProviderManager:
                 self._current_index = idx
                 return url
 
-        # None are healthy, try to re-check all
+        # None are healthy, try to re-check all. Probe in parallel and take the first
+        # healthy reply, so one stalled endpoint can't cost N x HEALTH_CHECK_TIMEOUT.
         logger.warning("No endpoints marked healthy, attempting to re-check all...")
-        for url in self.rpc_urls:
-            if self._check_endpoint_health(url):
-                self._current_index = self.rpc_urls.index(url)
-                return url
+        pool = ThreadPoolExecutor(max_workers=len(self.rpc_urls))
+        try:
+            futures = {pool.submit(self._check_endpoint_health, url): url for url in self.rpc_urls}
+            for future in as_completed(futures):
+                if future.result():
+                    url = futures[future]
+                    self._current_index = self.rpc_urls.index(url)
+                    return url
+        finally:
+            # Don't wait on slower probes; they finish in the background and still
+            # record their result in _endpoint_status.
+            pool.shutdown(wait=False, cancel_futures=True)
 
         return None
 
@@ -227,15 +321,13 @@ class ProviderManager:
             error: Optional error message
         """
         if url in self._endpoint_status:
-            self._endpoint_status[url]["healthy"] = False
-            self._endpoint_status[url]["last_check"] = time.time()
-            self._endpoint_status[url]["failure_count"] += 1
-            self._endpoint_status[url]["last_error"] = error or "Manually marked unhealthy"
+            self._record_failure(url, error or "Manually marked unhealthy")
             logger.warning(f"Marked RPC {url} as unhealthy: {error}")
 
             # If this was the current endpoint, force refresh
             if self.rpc_urls[self._current_index] == url:
                 self._web3_instance = None
+                self._chain_id = None
 
     def get_status(self) -> dict:
         """
@@ -254,6 +346,38 @@ class ProviderManager:
         }
 
 
+def inject_poa_middleware(web3: Web3) -> bool:
+    """
+    Inject ExtraDataToPOAMiddleware into a Web3 instance if it is not already present.
+
+    Returns:
+        True if the middleware was added, False if it was already installed
+    """
+    if "poa" in web3.middleware_onion:
+        return False
+    web3.middleware_onion.inject(ExtraDataToPOAMiddleware, name="poa", layer=0)
+    return True
+
+
+def _strip_unused_middleware(web3: Web3) -> None:
+    """Remove middleware the Tectonic/swap call paths never need (see UNUSED_MIDDLEWARE)."""
+    global _middleware_logged
+    onion = web3.middleware_onion
+    removed = []
+    for name in UNUSED_MIDDLEWARE:
+        try:
+            if name in onion:
+                onion.remove(name)
+                removed.append(name)
+        except (ValueError, TypeError):
+            # Name not present / different onion API in this web3 version
+            continue
+
+    if not _middleware_logged:
+        _middleware_logged = True
+        logger.info(f"Web3 middleware: removed {removed or 'none'}, {len(onion)} remaining")
+
+
 def create_provider_manager(
     rpc_urls: Optional[List[str]] = None,
     timeout: int = DEFAULT_RPC_TIMEOUT,
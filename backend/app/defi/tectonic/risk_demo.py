@@ -12,15 +12,19 @@ Usage:
     python -m app.defi.tectonic.risk_demo [--private-key 0x...]
 """
 
+from __future__ import annotations
+
 import argparse
 import os
 import sys
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
-from .client import TectonicClient, TectonicError
-from .risk_engine import RiskEngine, RiskStatus, HealthMetrics
+if TYPE_CHECKING:
+    from .client import TectonicClient, TectonicError
+    from .risk_engine import RiskEngine, RiskStatus, HealthMetrics
 
 load_dotenv()
 
@@ -114,8 +118,16 @@ def _test_safe_borrow_check(engine: RiskEngine, test_amount_usd: Decimal) -> Non
         print(f"[FAIL] NOT SAFE: {reason}")
 
 
+def _import_client() -> None:
+    """Import the web3-backed client and risk engine only once argument parsing has succeeded."""
+    global TectonicClient, TectonicError, RiskEngine, RiskStatus, HealthMetrics
+    from .client import TectonicClient, TectonicError
+    from .risk_engine import RiskEngine, RiskStatus, HealthMetrics
+
+
 def main() -> None:
     args = _parse_args()
+    _import_client()
 
     try:
         private_key = _get_private_key(args.private_key)
@@ -17,7 +17,6 @@ from typing import Any, List
 
 try:
     from web3 import Web3
-    from web3.middleware import ExtraDataToPOAMiddleware
 except ImportError:
     print(
         "Error: 'web3' module not found. Install dependencies first, e.g.:\n"
@@ -132,9 +131,7 @@ def connect_web3() -> Web3:
         try:
             print(f"Trying Cronos RPC: {url}")
             w3 = Web3(Web3.HTTPProvider(url, request_kwargs={"timeout": 10}))
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-            if not w3.is_connected():
-                raise RuntimeError("web3.is_connected() returned False")
+            # eth_chainId doubles as the connectivity probe (it raises if the RPC is unreachable)
             chain_id = w3.eth.chain_id
             if chain_id != TECTONIC_NETWORK.chain_id:
                 raise RuntimeError(
@@ -172,6 +169,8 @@ def check_erc20(
 
 def check_tusdc_and_comptroller(w3: Web3) -> None:
     """Verify that tUSDC is correctly wired to USDC and Comptroller."""
+    # Checksum each configured address once; on-chain results are compared
+    # case-insensitively instead of being re-checksummed (one keccak each).
     tusdc_addr = Web3.to_checksum_address(TECTONIC_ADDRESSES.tusdc)
     usdc_addr = Web3.to_checksum_address(TECTONIC_ADDRESSES.usdc)
     comptroller_addr_expected = Web3.to_checksum_address(TECTONIC_ADDRESSES.comptroller)
@@ -179,7 +178,7 @@ def check_tusdc_and_comptroller(w3: Web3) -> None:
     ttoken = w3.eth.contract(address=tusdc_addr, abi=TTOKEN_VERIFY_ABI)
     underlying_addr = ttoken.functions.underlying().call()
     print(f"- tUSDC.underlying(): {underlying_addr}")
-    if Web3.to_checksum_address(underlying_addr) != usdc_addr:
+    if underlying_addr.lower() != usdc_addr.lower():
         raise RuntimeError(f"tUSDC underlying mismatch. Expected {usdc_addr}, got {underlying_addr}.")
 
     # Core/comptroller relationship differs across deployments; on Cronos Tectonic this is often
@@ -188,7 +187,7 @@ def check_tusdc_and_comptroller(w3: Web3) -> None:
     try:
         core_addr_onchain = ttoken.functions.tectonicCore().call()
         print(f"- tUSDC.tectonicCore(): {core_addr_onchain}")
-        if Web3.to_checksum_address(core_addr_onchain) != comptroller_addr_expected:
+        if core_addr_onchain.lower() != comptroller_addr_expected.lower():
             print(
                 f"  WARNING: tUSDC core mismatch. Expected {comptroller_addr_expected}, "
                 f"got {core_addr_onchain}. This may indicate multiple pools / different core."
@@ -13,20 +13,37 @@ Intended for:
 - Integration testing hooks later
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import argparse
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
-from .client import TectonicClient, TectonicError, AccountLiquidity
+from app.units import to_smallest
+
+if TYPE_CHECKING:
+    from .client import TectonicClient, TectonicError, AccountLiquidity
 
 # Load environment variables from backend/.env if present so TECTONIC_PRIVATE_KEY
 # can be configured there as well as via the shell.
 load_dotenv()
 
 
+def _amount_arg(value: str) -> str:
+    """argparse type: keep the amount as typed (no float rounding), but validate it."""
+    try:
+        valid = Decimal(value).is_finite()
+    except InvalidOperation:
+        valid = False
+    if not valid:
+        raise argparse.ArgumentTypeError(f"invalid amount: {value!r}")
+    return value
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run a simple Tectonic USDC workflow on Cronos mainnet.",
@@ -41,14 +58,14 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--supply",
-        type=float,
-        default=10.0,
+        type=_amount_arg,
+        default="10.0",
         help="USDC amount to supply as collateral (default: 10.0).",
     )
     parser.add_argument(
         "--borrow",
-        type=float,
-        default=5.0,
+        type=_amount_arg,
+        default="5.0",
         help="USDC amount to borrow (default: 5.0).",
     )
     parser.add_argument(
@@ -68,8 +85,9 @@ def _get_private_key(cli_private_key: str | None) -> str:
     return pk
 
 
-def _to_wei(amount: float, decimals: int = 6) -> int:
-    return int(Decimal(str(amount)) * (10 ** decimals))
+def _to_wei(amount: str, decimals: int = 6) -> int:
+    """Convert a decimal amount string to smallest units, truncating extra digits."""
+    return to_smallest(amount, decimals)
 
 
 def _print_liquidity(client: TectonicClient) -> None:
@@ -79,8 +97,15 @@ def _print_liquidity(client: TectonicClient) -> None:
     )
 
 
+def _import_client() -> None:
+    """Import the web3-backed client only once argument parsing has succeeded."""
+    global TectonicClient, TectonicError, AccountLiquidity
+    from .client import TectonicClient, TectonicError, AccountLiquidity
+
+
 def main() -> None:
     args = _parse_args()
+    _import_client()
 
     try:
         private_key = _get_private_key(args.private_key)
@@ -12,13 +12,15 @@ Endpoints:
 - GET /tectonic/config - Get Tectonic config info
 """
 
+import threading
 from decimal import Decimal
 from typing import Dict, Optional
 
 from fastapi import APIRouter, HTTPException, Header
 from pydantic import BaseModel, Field
 
-from ..defi.tectonic.client import TectonicClient
+from ..defi.tectonic.client import TectonicClient, default_rpc_urls
+from ..defi.tectonic.providers import ProviderManager, create_provider_manager
 from ..defi.tectonic.risk_engine import RiskEngine
 from .service import (
     TectonicService,
@@ -83,6 +85,24 @@ class OperationResponseModel(BaseModel):
 
 # --- Service Initialization ---
 
+# One provider manager for the whole process: per-request clients share its
+# Web3 instance, endpoint health state and pooled HTTP connections instead of
+# re-probing RPCs and re-verifying the chain id on every request.
+_provider_manager: Optional[ProviderManager] = None
+_provider_manager_lock = threading.Lock()
+
+
+def get_provider_manager() -> ProviderManager:
+    """Return the process-wide ProviderManager, creating it on first use."""
+    global _provider_manager
+    if _provider_manager is None:
+        # Double-checked so concurrent first requests build exactly one manager
+        with _provider_manager_lock:
+            if _provider_manager is None:
+                _provider_manager = create_provider_manager(rpc_urls=default_rpc_urls())
+    return _provider_manager
+
+
 def get_service_for_request(request_data: Dict, private_key: Optional[str] = None) -> TectonicService:
     """Create a TectonicService instance for the request."""
     # Use provided private key or fetch from request
@@ -94,7 +114,7 @@ def get_service_for_request(request_data: Dict, private_key: Optional[str] = Non
         )
     
     # Create client
-    client = TectonicClient(private_key=pk)
+    client = TectonicClient(private_key=pk, provider_manager=get_provider_manager())
     
     # Create risk engine
     risk_engine = RiskEngine(client, safety_ltv=Decimal("0.75"))
@@ -344,7 +364,7 @@ async def get_position(address: str) -> PositionResponseModel:
             raise HTTPException(status_code=400, detail="Invalid address format")
         
         # Create a read-only client (no private key needed for query)
-        client = TectonicClient()
+        client = TectonicClient(provider_manager=get_provider_manager())
         client.address = address  # Set account address for read-only queries
         risk_engine = RiskEngine(client, safety_ltv=Decimal("0.75"))
         service = TectonicService(client, risk_engine=risk_engine)
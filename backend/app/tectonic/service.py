@@ -15,13 +15,20 @@ This layer handles:
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Optional, Tuple
 
 from web3 import Web3
 
-from ..defi.tectonic.client import TectonicClient, TectonicError, TectonicOperationError
+from ..defi.tectonic.client import (
+    TUSDC_ADDRESS,
+    TectonicClient,
+    TectonicError,
+    TectonicOperationError,
+    checksum_address,
+)
 from ..defi.tectonic.risk_engine import RiskEngine, HealthMetrics, RiskStatus
 
 logger = logging.getLogger(__name__)
@@ -116,25 +123,19 @@ class TectonicService:
     def _get_position_internal(self, address: Optional[str] = None) -> PositionInfo:
         """Internal: fetch raw position data."""
         try:
-            # Get raw balances
-            tusdc_balance = self.client.get_tusdc_balance(address)
-            borrowed = self.client.get_borrow_balance(address)
-            usdc_balance = self.client.get_usdc_balance(address)  # Wallet balance
-            
-            # Get liquidity info
-            liquidity = self.client.get_account_liquidity(address)
-            
-            # Get markets entered
-            markets = self.client.get_assets_in(address)
-            tusdc_addr = self.client.web3.to_checksum_address(
-                self.client.tusdc.address
-            )
-            is_collateral = tusdc_addr in [
-                self.client.web3.to_checksum_address(m) for m in markets
-            ]
-            
-            # Get health metrics from risk engine
-            health_metrics = self.risk_engine.get_health_metrics(address)
+            # The reads below are independent RPC round trips; issue them
+            # concurrently so latency is the slowest call rather than the sum.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                tusdc_future = pool.submit(self.client.get_tusdc_balance, address)
+                markets_future = pool.submit(self.client.get_assets_in, address)
+                health_future = pool.submit(self.risk_engine.get_health_metrics, address)
+                tusdc_balance = tusdc_future.result()
+                markets = markets_future.result()  # Markets entered
+                health_metrics = health_future.result()
+
+            # tUSDC's checksum is computed once at import; market addresses go
+            # through the memoized helper instead of re-hashing on every call
+            is_collateral = TUSDC_ADDRESS in {checksum_address(m) for m in markets}
             
             # Calculate liquidation buffer
             # This is how much more we can borrow before HF < 1.0
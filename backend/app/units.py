@@ -0,0 +1,44 @@
+"""
+Token amount unit conversion helpers.
+
+Shared by the balance agent and the Tectonic scripts to scale decimal amount
+strings to smallest units (wei) without float rounding.
+"""
+
+import re
+from decimal import ROUND_DOWN, Decimal
+
+# Powers of ten for every realistic token decimals value, computed once
+_POW10 = {d: 10**d for d in range(37)}
+
+# Plain "123" / "123.456" amounts that can be scaled with integer arithmetic. ASCII
+# digits only, matched with fullmatch (a "$" anchor would also accept a trailing newline).
+PLAIN_AMOUNT_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+
+def pow10(decimals: int) -> int:
+    """Return 10 ** decimals, from the precomputed table when in range."""
+    power = _POW10.get(decimals)
+    return power if power is not None else 10**decimals
+
+
+def to_smallest_decimal(amount: str, decimals: int) -> int:
+    """Decimal-based fallback for to_smallest (signs, scientific notation, etc.)."""
+    scaled = Decimal(amount) * (Decimal(10) ** decimals)
+    return int(scaled.to_integral_value(rounding=ROUND_DOWN))
+
+
+def to_smallest(amount: str, decimals: int) -> int:
+    """Convert a token-unit amount string to smallest units, truncating extra precision.
+
+    Args:
+        amount: Amount in token units (e.g. "0.25")
+        decimals: Token decimals
+
+    Returns:
+        Amount in smallest units (e.g. wei)
+    """
+    if not PLAIN_AMOUNT_RE.fullmatch(amount):
+        return to_smallest_decimal(amount, decimals)
+    whole, _, frac = amount.partition(".")
+    return int(whole) * pow10(decimals) + int((frac + "0" * decimals)[:decimals] or "0")
@@ -8,6 +8,7 @@ with blockchain-based micropayments on Cronos EVM network.
 import base64
 import json
 import os
+import random
 from typing import Any, Dict, Optional, Callable
 
 from dotenv import load_dotenv
@@ -305,9 +306,10 @@ class X402PaywallMiddleware(BaseHTTPMiddleware):
             )
 
             if not settle_result.get("success"):
-                # Retry settlement once
+                # Retry settlement once; jitter the delay so concurrent requests
+                # don't hit the facilitator in lockstep
                 import asyncio
-                await asyncio.sleep(1)
+                await asyncio.sleep(1 + random.random())
                 settle_result = self.facilitator_service.settle_payment(
                     x402_version=payment_payload.get("x402Version", 1),
                     payment_payload=payment_data,
@@ -20,33 +20,37 @@ async def premium_chat():
         "Explain DeFi to me"
     ]
     
-    async with httpx.AsyncClient() as client:
-        for message in test_messages:
-            print(f"\n{'='*60}")
-            print(f"User: {message}")
-            print(f"{'='*60}")
-            
-            try:
-                response = await client.post(
-                    url,
-                    json={"message": message},
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    assistant_response = result.get("response", "No response")
-                    print(f"Agent: {assistant_response}")
-                    print(f"Status: {result.get('status', 'unknown')}")
-                elif response.status_code == 402:
-                    print("Payment required (402) - Expected without x402 header")
-                    print(f"Response: {response.text}")
-                else:
-                    print(f"Error {response.status_code}: {response.text}")
-                    
-            except Exception as e:
-                print(f"Error: {e}")
-    
+    # Send all messages concurrently; wall-clock is the slowest reply, not the sum
+    limits = httpx.Limits(max_connections=len(test_messages))
+    async with httpx.AsyncClient(limits=limits) as client:
+        responses = await asyncio.gather(
+            *[client.post(url, json={"message": m}, timeout=30.0) for m in test_messages],
+            return_exceptions=True,
+        )
+
+    for message, response in zip(test_messages, responses, strict=True):
+        print(f"\n{'='*60}")
+        print(f"User: {message}")
+        print(f"{'='*60}")
+
+        try:
+            if isinstance(response, Exception):
+                raise response
+
+            if response.status_code == 200:
+                result = response.json()
+                assistant_response = result.get("response", "No response")
+                print(f"Agent: {assistant_response}")
+                print(f"Status: {result.get('status', 'unknown')}")
+            elif response.status_code == 402:
+                print("Payment required (402) - Expected without x402 header")
+                print(f"Response: {response.text}")
+            else:
+                print(f"Error {response.status_code}: {response.text}")
+
+        except Exception as e:
+            print(f"Error: {e}")
+
     print(f"\n{'='*60}")
     print("Test completed!")
 
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def s():
+    """The swap script module, imported once per session (skips if it isn't available)."""
+    return pytest.importorskip("swap_cronos_tokens")
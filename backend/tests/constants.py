@@ -0,0 +1,5 @@
+"""Constants shared by test modules."""
+
+# Sample token addresses (same as in swap_cronos_tokens), already checksummed
+USDC = "0xc21223249CA28397B4B6541dfFaEcC539BfF0c59"
+DAI = "0xF2001B145b43032AAF5Ee2884e456CCd805F677D"
@@ -0,0 +1,73 @@
+"""Tests for batched Bitquery balance queries."""
+
+import pytest
+
+from app.agents.balance import agent
+
+
+def test_build_batched_query_aliases_each_address() -> None:
+    """Test every address gets its own alias in a single document."""
+    addresses = ["0x" + "a" * 40, "0x" + "b" * 40, "0x" + "c" * 40]
+    query = agent.build_batched_query(addresses)
+    for i, address in enumerate(addresses):
+        assert f'a{i}: ethereum(network: cronos) {{ address(address: {{is: "{address}"}})' in query
+    assert query.count("ethereum(network: cronos)") == 3
+
+
+def test_build_batched_query_enforces_cap() -> None:
+    """Test oversized batches are rejected rather than sent."""
+    with pytest.raises(ValueError):
+        agent.build_batched_query(["0x" + "a" * 40] * (agent.MAX_BATCH_ADDRESSES + 1))
+
+
+def test_fetch_batch_preserves_order_and_validates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test invalid addresses short-circuit per item and results keep input order."""
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("unexpected Bitquery request")
+
+    monkeypatch.setattr(agent._SESSION, "post", fail_post)
+    results = agent.fetch_cronos_balances_batch(["not-an-address", "0xzz"])
+    assert [r["success"] for r in results] == [False, False]
+    assert "not-an-address" in results[0]["error"]
+    assert "0xzz" in results[1]["error"]
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.content = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_fetch_token_decimals_uses_one_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test decimals for several tokens come back from a single batched POST."""
+    # Fresh memo so earlier results can't skip the RPC and ours don't leak out
+    monkeypatch.setattr(agent, "_DECIMALS_CACHE", {})
+    posts = []
+
+    def fake_post(url, json=None, timeout=None):
+        posts.append(json)
+        replies = [
+            {"jsonrpc": "2.0", "id": 1, "result": "0x" + "12".rjust(64, "0")},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x" + "6".rjust(64, "0")},
+        ]
+        return _FakeResponse(agent._json_dumps(replies).encode())
+
+    monkeypatch.setattr(agent._SESSION, "post", fake_post)
+    resolved = agent.fetch_token_decimals(["0x" + "a" * 40, "0x" + "b" * 40], "https://rpc")
+    assert resolved == {"0x" + "a" * 40: 6, "0x" + "b" * 40: 18}
+    assert len(posts) == 1 and isinstance(posts[0], list)
+
+
+def test_fetch_token_decimals_reuses_cached_answers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test previously resolved decimals are served without another RPC."""
+    address = "0x" + "c" * 40
+    monkeypatch.setitem(agent._DECIMALS_CACHE, ("https://rpc", address), 8)
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("unexpected RPC")
+
+    monkeypatch.setattr(agent._SESSION, "post", fail_post)
+    assert agent.fetch_token_decimals([address], "https://rpc") == {address: 8}
@@ -0,0 +1,38 @@
+"""Tests for the balance agent's in-process cache."""
+
+import time
+
+from app.agents.balance import agent
+
+
+def test_cache_hit_returns_isolated_copy() -> None:
+    """Test cached results are deep-copied so callers can't corrupt the cache."""
+    address = "0x" + "ab" * 20
+    key = agent._cache_key(address)
+    agent._store_cached_balance(key, {"success": True, "balances": [{"value": "1"}], "cached": False})
+    try:
+        first = agent.fetch_cronos_balances(address)
+        assert first["cached"] is True
+        first["balances"][0]["value"] = "999"
+
+        second = agent.fetch_cronos_balances(address)
+        assert second["balances"][0]["value"] == "1"
+    finally:
+        agent._BALANCE_CACHE.pop(key, None)
+
+
+def test_store_evicts_expired_entries() -> None:
+    """Test inserting into the cache drops entries older than the TTL."""
+    stale_key = agent._cache_key("0x" + "cd" * 20)
+    fresh_key = agent._cache_key("0x" + "ef" * 20)
+    agent._BALANCE_CACHE[stale_key] = {
+        "timestamp": time.monotonic() - agent.BALANCE_CACHE_TTL - 1,
+        "data": {"success": True},
+    }
+    try:
+        agent._store_cached_balance(fresh_key, {"success": True})
+        assert stale_key not in agent._BALANCE_CACHE
+        assert fresh_key in agent._BALANCE_CACHE
+    finally:
+        agent._BALANCE_CACHE.pop(stale_key, None)
+        agent._BALANCE_CACHE.pop(fresh_key, None)
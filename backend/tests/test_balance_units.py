@@ -0,0 +1,40 @@
+"""Tests for token amount unit conversion helpers."""
+
+from decimal import ROUND_DOWN, Decimal
+
+import pytest
+
+from app.units import to_smallest
+
+
+@pytest.mark.parametrize(
+    "amount,decimals",
+    [
+        ("0", 18),
+        ("0.0", 18),
+        ("0.25", 6),
+        ("1.0000001", 6),
+        ("0.200826", 6),
+        ("24827.849010682339425216", 18),
+        ("123", 0),
+        ("0.9", 0),
+    ],
+)
+def test_to_smallest_matches_decimal(amount: str, decimals: int) -> None:
+    """Test integer fast path agrees with truncating Decimal scaling."""
+    expected = int(
+        (Decimal(amount) * (Decimal(10) ** decimals)).to_integral_value(rounding=ROUND_DOWN)
+    )
+    assert to_smallest(amount, decimals) == expected
+
+
+def test_to_smallest_decimal_fallback() -> None:
+    """Test scientific notation and signed amounts use the Decimal fallback."""
+    assert to_smallest("1e-6", 6) == 1
+    assert to_smallest("-0.5", 2) == -50
+
+
+@pytest.mark.parametrize("amount", ["1.5\n", " 1.5", "\u0661.5"])
+def test_to_smallest_non_plain_input_uses_decimal(amount: str) -> None:
+    """Test whitespace and non-ASCII digits skip the integer fast path."""
+    assert to_smallest(amount, 6) == int(Decimal(amount) * 10**6)
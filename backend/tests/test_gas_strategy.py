@@ -0,0 +1,46 @@
+"""Tests for the Tectonic EIP-1559 gas strategy."""
+
+from types import SimpleNamespace
+
+from web3 import Web3
+
+from app.defi.tectonic.gas import MAX_PRIORITY_FEE_GWEI, MIN_PRIORITY_FEE_GWEI, GasStrategy
+
+
+class _FakeEth:
+    def __init__(self, rewards=None) -> None:
+        self.fee_history_calls = 0
+        gwei = 10**9
+        self.rewards = rewards if rewards is not None else [[0], [gwei], [2 * gwei], [3 * gwei], [0]]
+
+    def fee_history(self, block_count, newest_block, percentiles):
+        self.fee_history_calls += 1
+        gwei = 10**9
+        return {
+            "baseFeePerGas": [5 * gwei] * block_count + [6 * gwei],
+            "reward": self.rewards,
+        }
+
+
+def test_gas_params_use_single_fee_history_call() -> None:
+    """Test base fee and tip come from one cached eth_feeHistory sample."""
+    eth = _FakeEth()
+    web3 = SimpleNamespace(eth=eth, to_wei=Web3.to_wei, from_wei=Web3.from_wei)
+    strategy = GasStrategy(web3)
+
+    params = strategy.calculate_gas_params(gas_limit=100_000)
+    strategy.calculate_gas_params(gas_limit=100_000)
+
+    assert eth.fee_history_calls == 1
+    assert params.max_priority_fee_per_gas == 2 * 10**9
+    assert params.max_fee_per_gas == 2 * 6 * 10**9 + 2 * 10**9
+
+
+def test_fee_history_tip_is_clamped_to_bounds() -> None:
+    """Test an out-of-range median tip is capped/floored instead of replaced by the default."""
+    gwei = 10**9
+    high = GasStrategy(SimpleNamespace(eth=_FakeEth([[50 * gwei]] * 5), to_wei=Web3.to_wei, from_wei=Web3.from_wei))
+    assert high.calculate_gas_params(gas_limit=1).max_priority_fee_per_gas == Web3.to_wei(MAX_PRIORITY_FEE_GWEI, "gwei")
+
+    low = GasStrategy(SimpleNamespace(eth=_FakeEth([[1]] * 5), to_wei=Web3.to_wei, from_wei=Web3.from_wei))
+    assert low.calculate_gas_params(gas_limit=1).max_priority_fee_per_gas == Web3.to_wei(MIN_PRIORITY_FEE_GWEI, "gwei")